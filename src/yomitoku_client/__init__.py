@@ -23,13 +23,7 @@ from .renderers.json_renderer import JSONRenderer
 
 # Import renderers
 from .renderers.markdown_renderer import MarkdownRenderer
-from .renderers.pdf_renderer import PDFRenderer
-from .renderers.searchable_pdf import (
-    create_searchable_pdf,
-)
-
-# Import visualizers
-from .visualizers.document_visualizer import DocumentVisualizer
+from .utils import lazy_getattr
 
 __all__ = [
     "DocumentResult",
@@ -49,6 +43,16 @@ __all__ = [
 ]
 
 
+# Modules imported on first attribute access (PEP 562) to keep import light
+_LAZY_ATTRS = {
+    "PDFRenderer": ".renderers.pdf_renderer",
+    "DocumentVisualizer": ".visualizers.document_visualizer",
+    "create_searchable_pdf": ".renderers.searchable_pdf",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_ATTRS)
+
+
 # Post-installation hook to ensure font is available
 def _ensure_font_available():
     """Ensure MPLUS1p-Medium font is available from resource directory"""
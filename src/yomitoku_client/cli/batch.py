@@ -1,14 +1,19 @@
 import asyncio
-import json
+import glob
 import os
+from pathlib import Path
 
 import click
 
 from yomitoku_client import YomitokuClient, parse_pydantic_model
 from yomitoku_client.client import CircuitConfig, RequestConfig
+from yomitoku_client.logger import set_logger
+from yomitoku_client.utils import json_dumps, json_loads
 
 from .utils import parse_formats, parse_pages
 
+logger = set_logger(__name__, "INFO")
+
 
 async def process_batch(
     input_dir,
@@ -55,6 +60,300 @@ async def process_batch(
         )
 
 
+# 出力の再利用可否を判定するため、生成時のオプションを記録する項目
+_STAMP_OPTIONS = (
+    "extract_formats",
+    "split_mode",
+    "page_index",
+    "dpi",
+    "ignore_line_break",
+    "vis_mode",
+)
+
+
+def make_stamp(options):
+    """Serialize the options that affect the outputs of a processed file."""
+    return json_dumps({key: options[key] for key in _STAMP_OPTIONS})
+
+
+def get_stamp_path(log, out_formatted):
+    """Return the path of the file recording the options used for a log."""
+    return os.path.join(out_formatted, f".{Path(log['file_path']).stem}.stamp")
+
+
+def is_up_to_date(
+    log,
+    stamp,
+    out_formatted,
+    out_visualize,
+    extract_formats,
+    split_mode,
+    vis_mode,
+):
+    """Check whether the outputs of a log are current and built with `stamp`."""
+    try:
+        with open(get_stamp_path(log, out_formatted), "rb") as f:
+            if f.read() != stamp:
+                return False
+    except FileNotFoundError:
+        return False
+
+    base = glob.escape(Path(log["file_path"]).stem)
+    suffix = "" if split_mode == "combine" else "_page_*"
+    dir_formatted = glob.escape(out_formatted)
+    dir_visualize = glob.escape(out_visualize)
+
+    patterns = [
+        os.path.join(dir_formatted, f"{base}{suffix}.{ext}") for ext in extract_formats
+    ]
+    vis_modes = {"both": ["ocr", "layout"], "ocr": ["ocr"], "layout": ["layout"]}
+    patterns.extend(
+        os.path.join(dir_visualize, f"{base}_{mode}_page_*.jpg")
+        for mode in vis_modes.get(vis_mode, [])
+    )
+
+    result_mtime = os.path.getmtime(log["output_path"])
+    for pattern in patterns:
+        paths = glob.glob(pattern)
+        if not paths:
+            return False
+        if any(os.path.getmtime(path) < result_mtime for path in paths):
+            return False
+
+    return True
+
+
+def process_log(
+    log,
+    data,
+    out_formatted,
+    out_visualize,
+    extract_formats,
+    split_mode,
+    page_index,
+    dpi,
+    ignore_line_break,
+    vis_mode,
+):
+    """Convert and visualize the analysis result of a single processed file."""
+    # 読み込んだbytesをそのまま渡し、デコードせずにパースする
+    # （このコマンドが書き出した解析結果のため、検証は省略する）
+    model = parse_pydantic_model(data, validate=False)
+
+    input_path = log["file_path"]
+    output_file_base = os.path.join(out_formatted, Path(input_path).stem)
+
+    # 画像を使う出力間で共有し、元ファイルの読み込み・ラスター化を一度で済ませる
+    images = None
+    if vis_mode != "none" or not {"html", "md", "pdf"}.isdisjoint(extract_formats):
+        images = model.load_page_images(input_path, page_index=page_index, dpi=dpi)
+
+    if "json" in extract_formats:
+        output_file_path = output_file_base + ".json"
+        model.to_json(
+            output_path=output_file_path,
+            mode=split_mode,
+            page_index=page_index,
+            ignore_line_break=ignore_line_break,
+        )
+    if "csv" in extract_formats:
+        output_file_path = output_file_base + ".csv"
+        model.to_csv(
+            output_path=output_file_path,
+            mode=split_mode,
+            page_index=page_index,
+            ignore_line_break=ignore_line_break,
+        )
+    if "html" in extract_formats:
+        output_file_path = output_file_base + ".html"
+        model.to_html(
+            output_path=output_file_path,
+            image_path=input_path,
+            images=images,
+            mode=split_mode,
+            dpi=dpi,
+            page_index=page_index,
+            ignore_line_break=ignore_line_break,
+        )
+    if "md" in extract_formats:
+        output_file_path = output_file_base + ".md"
+        model.to_markdown(
+            output_path=output_file_path,
+            image_path=input_path,
+            images=images,
+            mode=split_mode,
+            dpi=dpi,
+            page_index=page_index,
+            ignore_line_break=ignore_line_break,
+        )
+    if "pdf" in extract_formats:
+        output_file_path = output_file_base + ".pdf"
+        model.to_pdf(
+            output_path=output_file_path,
+            image_path=input_path,
+            images=images,
+            mode=split_mode,
+            dpi=dpi,
+            page_index=page_index,
+        )
+
+    # 解析結果の可視化
+    if vis_mode in ["both", "ocr"]:
+        model.visualize(
+            image_path=input_path,
+            images=images,
+            mode="ocr",
+            output_directory=out_visualize,
+            dpi=dpi,
+            page_index=page_index,
+        )
+
+    if vis_mode in ["both", "layout"]:
+        model.visualize(
+            image_path=input_path,
+            images=images,
+            mode="layout",
+            output_directory=out_visualize,
+            dpi=dpi,
+            page_index=page_index,
+        )
+
+
+def process_log_with_stamp(log, data, stamp, **kwargs):
+    """Run process_log and record the options it was run with."""
+    stamp_path = Path(get_stamp_path(log, kwargs["out_formatted"]))
+    # 途中で失敗した場合に古い記録で最新と判定されないよう、先に削除する
+    stamp_path.unlink(missing_ok=True)
+    process_log(log, data, **kwargs)
+    stamp_path.write_bytes(stamp)
+
+
+def iter_process_logs(path):
+    """Yield the entries of a process log (JSONL) one line at a time."""
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json_loads(line)
+
+
+async def process_logs(logs, workers, force=False, **kwargs):
+    """Post-process the successful logs concurrently in worker threads."""
+    # 描画ライブラリの過剰な並列化を避けるため同時実行数を制限する
+    concurrency = max(1, min(workers, os.cpu_count() or 1))
+    logs = iter(logs)
+    failures = []
+    stamp = make_stamp(kwargs)
+
+    async def _worker():
+        # ワーカー間で同じイテレータを共有し、ログを逐次読み込みながら処理する
+        for log in logs:
+            if not log.get("success"):
+                continue
+
+            try:
+                # 出力が解析結果より新しければ再生成をスキップ
+                if not force and await asyncio.to_thread(
+                    is_up_to_date,
+                    log,
+                    stamp,
+                    kwargs["out_formatted"],
+                    kwargs["out_visualize"],
+                    kwargs["extract_formats"],
+                    kwargs["split_mode"],
+                    kwargs["vis_mode"],
+                ):
+                    logger.info("Skipping %s: outputs are up to date", log["file_path"])
+                    continue
+
+                # 解析結果のJSONはイベントループを塞がないようスレッドで読み込む
+                data = await asyncio.to_thread(Path(log["output_path"]).read_bytes)
+                await asyncio.to_thread(
+                    process_log_with_stamp, log, data, stamp, **kwargs
+                )
+            except Exception as e:
+                # 他のファイルの処理は続け、失敗は最後にまとめて報告する
+                logger.error("Failed to post-process %s: %s", log["file_path"], e)
+                failures.append(log["file_path"])
+
+    await asyncio.gather(*[_worker() for _ in range(concurrency)])
+
+    if failures:
+        raise click.ClickException(
+            f"Failed to post-process {len(failures)} file(s): {', '.join(failures)}"
+        )
+
+
+async def run_batch(
+    input_dir,
+    output_dir,
+    endpoint,
+    region=None,
+    extract_formats=("json",),
+    split_mode="combine",
+    page_index=None,
+    dpi=200,
+    profile=None,
+    request_timeout=None,
+    total_timeout=None,
+    ignore_line_break=False,
+    vis_mode="both",
+    workers=4,
+    threthold_circuit=5,
+    cooldown_time=30,
+    read_timeout=60,
+    connect_timeout=10,
+    max_retries=3,
+    overwrite=False,
+    force=False,
+):
+    """Analyze every file in a directory and export the formatted results.
+
+    Can be awaited from an existing event loop, e.g. to process several
+    directories with asyncio.gather.
+    """
+    # バッチ処理の実行
+    await process_batch(
+        input_dir=input_dir,
+        output_dir=output_dir,
+        endpoint=endpoint,
+        region=region,
+        page_index=page_index,
+        dpi=dpi,
+        profile=profile,
+        request_timeout=request_timeout,
+        total_timeout=total_timeout,
+        workers=workers,
+        threthold_circuit=threthold_circuit,
+        cooldown_time=cooldown_time,
+        read_timeout=read_timeout,
+        connect_timeout=connect_timeout,
+        max_retries=max_retries,
+        overwrite=overwrite,
+    )
+
+    out_formatted = os.path.join(output_dir, "formatted")
+    out_visualize = os.path.join(output_dir, "visualization")
+
+    os.makedirs(out_formatted, exist_ok=True)
+    os.makedirs(out_visualize, exist_ok=True)
+
+    # ログから成功したファイルを処理
+    await process_logs(
+        iter_process_logs(os.path.join(output_dir, "process_log.jsonl")),
+        workers=workers,
+        out_formatted=out_formatted,
+        out_visualize=out_visualize,
+        extract_formats=extract_formats,
+        split_mode=split_mode,
+        page_index=page_index,
+        dpi=dpi,
+        ignore_line_break=ignore_line_break,
+        vis_mode=vis_mode,
+        force=force,
+    )
+
+
 @click.command("batch")
 @click.option(
     "--input_dir",
@@ -183,6 +482,12 @@ async def process_batch(
     default=False,
     help="Overwrite existing output files",
 )
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Regenerate formatted outputs and visualizations even if up to date",
+)
 def batch_command(
     input_dir,
     output_dir,
@@ -204,6 +509,7 @@ def batch_command(
     connect_timeout,
     max_retries,
     overwrite,
+    force,
 ):
     page_index = None
     if pages is not None:
@@ -211,18 +517,22 @@ def batch_command(
 
     extract_formats = parse_formats(file_format)
 
-    # バッチ処理の実行
+    # バッチ処理と整形出力を一つのイベントループで実行
     asyncio.run(
-        process_batch(
+        run_batch(
             input_dir=input_dir,
             output_dir=output_dir,
             endpoint=endpoint,
             region=region,
+            extract_formats=extract_formats,
+            split_mode=split_mode,
             page_index=page_index,
             dpi=dpi,
             profile=profile,
             request_timeout=request_timeout,
             total_timeout=total_timeout,
+            ignore_line_break=ignore_line_break,
+            vis_mode=vis_mode,
             workers=workers,
             threthold_circuit=threthold_circuit,
             cooldown_time=cooldown_time,
@@ -230,93 +540,6 @@ def batch_command(
             connect_timeout=connect_timeout,
             max_retries=max_retries,
             overwrite=overwrite,
+            force=force,
         )
     )
-
-    out_formatted = os.path.join(output_dir, "formatted")
-    out_visualize = os.path.join(output_dir, "visualization")
-
-    os.makedirs(out_formatted, exist_ok=True)
-    os.makedirs(out_visualize, exist_ok=True)
-
-    # ログから成功したファイルを処理
-    with open(os.path.join(output_dir, "process_log.jsonl"), encoding="utf-8") as f:
-        logs = [json.loads(line) for line in f if line.strip()]
-
-    for log in logs:
-        if not log.get("success"):
-            continue
-
-        # 解析結果のJSONを読み込み
-        with open(log["output_path"], encoding="utf-8") as rf:
-            result = json.load(rf)
-
-        model = parse_pydantic_model(result)
-
-        input_path = log["file_path"]
-        base = os.path.splitext(os.path.basename(log["file_path"]))[0]
-
-        if "json" in extract_formats:
-            output_file_path = os.path.join(out_formatted, f"{base}.json")
-            model.to_json(
-                output_path=output_file_path,
-                mode=split_mode,
-                page_index=page_index,
-                ignore_line_break=ignore_line_break,
-            )
-        if "csv" in extract_formats:
-            output_file_path = os.path.join(out_formatted, f"{base}.csv")
-            model.to_csv(
-                output_path=output_file_path,
-                mode=split_mode,
-                page_index=page_index,
-                ignore_line_break=ignore_line_break,
-            )
-        if "html" in extract_formats:
-            output_file_path = os.path.join(out_formatted, f"{base}.html")
-            model.to_html(
-                output_path=output_file_path,
-                image_path=input_path,
-                mode=split_mode,
-                dpi=dpi,
-                page_index=page_index,
-                ignore_line_break=ignore_line_break,
-            )
-        if "md" in extract_formats:
-            output_file_path = os.path.join(out_formatted, f"{base}.md")
-            model.to_markdown(
-                output_path=output_file_path,
-                image_path=input_path,
-                mode=split_mode,
-                dpi=dpi,
-                page_index=page_index,
-                ignore_line_break=ignore_line_break,
-            )
-        if "pdf" in extract_formats:
-            output_file_path = os.path.join(out_formatted, f"{base}.pdf")
-            model.to_pdf(
-                output_path=output_file_path,
-                image_path=input_path,
-                mode=split_mode,
-                dpi=dpi,
-                page_index=page_index,
-            )
-
-        # 解析結果の可視化
-        if vis_mode in ["both", "ocr"]:
-            model.visualize(
-                image_path=input_path,
-                mode="ocr",
-                output_directory=out_visualize,
-                dpi=dpi,
-                page_index=page_index,
-            )
-
-        if vis_mode in ["both", "layout"]:
-            model.visualize(
-                image_path=input_path,
-                mode="layout",
-                output_directory=out_visualize,
-                dpi=dpi,
-                page_index=page_index,
-            )
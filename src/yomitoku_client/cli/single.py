@@ -1,4 +1,3 @@
-import json
 import os
 from pathlib import Path
 
@@ -6,6 +5,7 @@ import click
 
 from yomitoku_client import YomitokuClient, parse_pydantic_model
 from yomitoku_client.client import CircuitConfig, RequestConfig
+from yomitoku_client.utils import json_dumps
 
 from .utils import parse_formats, parse_pages
 
@@ -201,10 +201,16 @@ def single_command(
 
         intermediate_file_path = intermediate_dir / f"{base_file_name}_{base_ext}.json"
 
-        with open(intermediate_file_path, "w") as f:
-            json.dump(result, f, indent=4)
+        with open(intermediate_file_path, "wb") as f:
+            f.write(json_dumps(result, indent=True))
 
-    model = parse_pydantic_model(result)
+    # The result was just returned by the endpoint, so skip re-validating it
+    model = parse_pydantic_model(result, validate=False)
+
+    # Load the input once and share the page images across image-based outputs
+    images = None
+    if vis_mode != "none" or not {"html", "md", "pdf"}.isdisjoint(extract_formats):
+        images = model.load_page_images(input_path, page_index=page_index, dpi=dpi)
 
     if "json" in extract_formats:
         output_file_path = output_file_base + ".json"
@@ -227,47 +233,57 @@ def single_command(
         model.to_html(
             output_path=output_file_path,
             image_path=input_path,
+            images=images,
             mode=split_mode,
             dpi=dpi,
             page_index=page_index,
             ignore_line_break=ignore_line_break,
+            max_workers=workers,
         )
     if "md" in extract_formats:
         output_file_path = output_file_base + ".md"
         model.to_markdown(
             output_path=output_file_path,
             image_path=input_path,
+            images=images,
             mode=split_mode,
             dpi=dpi,
             page_index=page_index,
             ignore_line_break=ignore_line_break,
+            max_workers=workers,
         )
     if "pdf" in extract_formats:
         output_file_path = output_file_base + ".pdf"
         model.to_pdf(
             output_path=output_file_path,
             image_path=input_path,
+            images=images,
             mode=split_mode,
             dpi=dpi,
             page_index=page_index,
+            max_workers=workers,
         )
 
     if vis_mode in ["both", "ocr"]:
         model.visualize(
             image_path=input_path,
+            images=images,
             mode="ocr",
             output_directory=output_dir,
             dpi=dpi,
             page_index=page_index,
+            max_workers=workers,
         )
 
     if vis_mode in ["both", "layout"]:
         model.visualize(
             image_path=input_path,
+            images=images,
             mode="layout",
             output_directory=output_dir,
             dpi=dpi,
             page_index=page_index,
+            max_workers=workers,
         )
 
 
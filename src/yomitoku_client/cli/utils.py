@@ -12,20 +12,23 @@ def parse_pages(pages_str):
     return sorted(pages)
 
 
+# 出力形式（別名を含む）ごとのファイル拡張子
+_FORMAT_EXT = {
+    "json": "json",
+    "csv": "csv",
+    "html": "html",
+    "htm": "html",
+    "markdown": "md",
+    "md": "md",
+    "pdf": "pdf",
+}
+
+
 def get_format_ext(file_format: str) -> str:
-    file_format = file_format.lower()
-    if file_format in ["json"]:
-        return "json"
-    elif file_format in ["csv"]:
-        return "csv"
-    elif file_format in ["html", "htm"]:
-        return "html"
-    elif file_format in ["markdown", "md"]:
-        return "md"
-    elif file_format in ["pdf"]:
-        return "pdf"
-    else:
+    ext = _FORMAT_EXT.get(file_format.lower())
+    if ext is None:
         raise ValueError(f"Unsupported format: {file_format}")
+    return ext
 
 
 def parse_formats(formats):
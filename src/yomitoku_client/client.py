@@ -1,9 +1,13 @@
 import asyncio
+import functools
 import json
 import math
 import os
+import random
+import statistics
 import threading
 import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -11,13 +15,22 @@ from pathlib import Path
 
 import boto3
 from botocore.config import Config
-from botocore.exceptions import BotoCoreError, ClientError
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    ConnectionError as BotoConnectionError,
+    HTTPClientError,
+)
 
 from yomitoku_client.logger import set_logger
 from yomitoku_client.utils import (
+    json_dumps,
+    json_loads,
     load_pdf_to_bytes,
     load_tiff_to_bytes,
     make_page_index,
+    open_pdf,
+    render_pdf_page_to_bytes,
 )
 
 from .constants import SUPPORT_INPUT_FORMAT
@@ -27,7 +40,7 @@ logger = set_logger(__name__, "INFO")
 JST = timezone(timedelta(hours=9), name="Asia/Tokyo")
 
 
-@dataclass
+@dataclass(slots=True)
 class PagePayload:
     index: int
     content_type: str
@@ -35,7 +48,7 @@ class PagePayload:
     source_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class InvokeResult:
     index: int
     raw_dict: dict  # SageMaker JSON
@@ -45,6 +58,7 @@ class InvokeResult:
 class CircuitConfig:
     threshold: int = 5  # サーキットブレーカーの失敗閾値
     cooldown_time: int = 30  # サーキットオープン後のクールダウン時間（秒）
+    max_cooldown_time: int = 300  # 試行失敗で延長されるクールダウン時間の上限（秒）
 
 
 @dataclass
@@ -52,20 +66,47 @@ class RequestConfig:
     read_timeout: int = 60
     connect_timeout: int = 10
     max_retries: int = 3
+    backoff_base: float = 0.5  # 再試行の基本待ち時間（秒）
+    backoff_max: float = 20.0  # 再試行の最大待ち時間（秒）
+
+
+# 再試行・サーキットブレーカーの対象とするHTTPステータス
+_RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+# ステータスによらず再試行するSageMakerのエラーコード
+_RETRYABLE_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "ModelNotReadyException",
+        "ServiceUnavailable",
+        "InternalFailure",
+        "RequestTimeout",
+    },
+)
+# 再試行する通信エラー（認証情報やパラメータの誤りなどは即座に失敗させる）
+_RETRYABLE_BOTO_ERRORS = (BotoConnectionError, HTTPClientError)
+# レイテンシ悪化時にリクエストを間引く確率の上限
+_LATENCY_DROP_MAX = 0.3
+# 全体タイムアウトをp95レイテンシから算出するのに必要なサンプル数
+_LATENCY_MIN_SAMPLES = 20
+
+
+# 拡張子ごとのContent-Type
+_EXT_TO_CT = {
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+}
 
 
 def guess_content_type(path: str) -> str:
-    _, ext = os.path.splitext(path)
-    ext = ext.lower()
-    if ext == ".pdf":
-        return "application/pdf"
-    if ext in [".png"]:
-        return "image/png"
-    if ext in [".jpg", ".jpeg"]:
-        return "image/jpeg"
-    if ext in [".tif", ".tiff"]:
-        return "image/tiff"
-    raise ValueError(f"Unsupported file extension: {ext}")
+    ext = os.path.splitext(path)[1].lower()
+    content_type = _EXT_TO_CT.get(ext)
+    if content_type is None:
+        raise ValueError(f"Unsupported file extension: {ext}")
+    return content_type
 
 
 def load_image_bytes(
@@ -89,18 +130,119 @@ def now_ms() -> int:
     return int(time.time() * 1000)
 
 
+class _AIMDLimiter:
+    """AIMD（加算増加・乗算減少）で同時実行数を調整するリミッター
+
+    失敗時は同時実行数の上限を半分に下げ、上限分の成功が続くごとに1ずつ戻す。
+    イベントループ上でのみ使用する（スレッドセーフではない）。
+    """
+
+    def __init__(self, limit: int, decrease: float = 0.5):
+        self.limit = max(1, limit)
+        self.target = self.limit
+        self._decrease = decrease
+        self._in_flight = 0
+        self._successes = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def __aenter__(self):
+        while self._in_flight >= self.target:
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                if fut in self._waiters:
+                    self._waiters.remove(fut)
+                else:
+                    # 起床済みの枠を他の待機者に譲る
+                    self._wake()
+                raise
+        self._in_flight += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        free = self.target - self._in_flight
+        while free > 0 and self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                free -= 1
+
+    def on_success(self):
+        self._successes += 1
+        if self._successes >= self.target:
+            self._successes = 0
+            if self.target < self.limit:
+                self.target += 1
+                self._wake()
+
+    def on_failure(self):
+        self._successes = 0
+        self.target = max(1, int(self.target * self._decrease))
+
+
+def _client_config(
+    read_timeout: int,
+    connect_timeout: int,
+    max_pool_connections: int = 10,
+) -> Config:
+    # 再試行は_ainvoke_oneで非同期に行うため、boto3内部の再試行は無効化
+    # （ワーカースレッドがバックオフ中にブロックされるのを防ぐ）
+    return Config(
+        retries={
+            "total_max_attempts": 1,
+            "mode": "standard",
+        },
+        read_timeout=read_timeout,
+        connect_timeout=connect_timeout,
+        max_pool_connections=max_pool_connections,
+    )
+
+
+@functools.cache
+def _runtime_client(
+    region: str | None,
+    profile: str | None,
+    read_timeout: int,
+    connect_timeout: int,
+    max_pool_connections: int,
+):
+    """設定ごとにsagemaker-runtimeクライアントを共有する
+
+    boto3のクライアントはスレッドセーフなため、インスタンス間で使い回して
+    接続プール（TLSセッション）の確立をクライアント生成のたびに行わない。
+    """
+    sess = boto3.Session(region_name=region, profile_name=profile)
+    cfg = _client_config(read_timeout, connect_timeout, max_pool_connections)
+    return sess.client("sagemaker-runtime", config=cfg)
+
+
+def _is_retryable_client_error(e: ClientError) -> bool:
+    """一時的なエラー（スロットリング・サーバー側の障害）かどうか"""
+    code = int(e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) or 0)
+    return (
+        code in _RETRYABLE_STATUS
+        or e.response.get("Error", {}).get("Code") in _RETRYABLE_CODES
+    )
+
+
 def _merge_results(results: list[InvokeResult]) -> dict:
     base = dict(results[0].raw_dict)
     key = "result"
-    base[key][0]["num_page"] = results[0].index
     if not isinstance(base.get(key), list):
         return base
-    for r in results[1:]:
-        items = r.raw_dict.get(key, [])
-        if isinstance(items, list):
-            for item in items:
-                item["num_page"] = r.index
-                base[key].append(item)
+
+    # 各ページの結果を一度で連結（入力のdictは書き換えない）
+    base[key] = [
+        {**item, "num_page": r.index}
+        for r in results
+        if isinstance(r.raw_dict.get(key), list)
+        for item in r.raw_dict[key]
+    ]
     return base
 
 
@@ -117,6 +259,8 @@ class YomitokuClient:
         logger.info("YomitokuClient initialized")
         self.endpoint = endpoint
         self.region = region
+        self._profile = profile
+        self._max_workers = max_workers
 
         self._cb_lock = threading.Lock()
 
@@ -128,7 +272,15 @@ class YomitokuClient:
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
 
-        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        # スレッドプールはクライアントごとに持つ（他のクライアントと共有しない）。
+        # 共有すると他クライアントのジョブの待ち時間が request_timeout に含まれてしまう。
+        # スレッドは submit 時に必要な分だけ生成されるため、未使用のクライアントではコストはない
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="yomitoku",
+        )
+        # エンドポイントへの同時リクエスト数（クライアント内の全ページで共有）
+        self._limiter = _AIMDLimiter(max_workers)
 
         if request_config is None:
             self._request_config = RequestConfig()
@@ -141,22 +293,32 @@ class YomitokuClient:
             self._circuit_config = circuit_config
 
         # Circuit breaker
+        self._circuit_state = "closed"  # closed / open / half_open
         self._circuit_failures = 0  # 連続失敗カウント
         self._circuit_open_until = 0  # サーキットオープン中の終了時刻（ミリ秒）
+        # 現在のクールダウン（秒）
+        self._circuit_cooldown = self._circuit_config.cooldown_time
+        self._circuit_probing = False  # half_open中の試行リクエストが実行中か
+        self._latency_baseline = 0.0  # 平常時のレイテンシ（秒）
+        self._latency_current = 0.0  # 直近のレイテンシのEMA（秒）
+        self._latency_samples = deque(maxlen=256)  # 直近のレイテンシ（秒）
         self._connect()
 
     def _connect(self):
-        # boto3の短期間再試行ポリシーを設定
-        cfg = Config(
-            retries={
-                "max_attempts": self._request_config.max_retries,
-                "mode": "standard",
-            },
-            read_timeout=self._request_config.read_timeout,
-            connect_timeout=self._request_config.connect_timeout,
+        # 同時実行数が接続プールの上限（デフォルト10）で頭打ちにならないようにする
+        self.sagemaker_runtime = _runtime_client(
+            self.region,
+            self._profile,
+            self._request_config.read_timeout,
+            self._request_config.connect_timeout,
+            max(self._max_workers, 10),
         )
 
-        self.sagemaker_runtime = self._sess.client("sagemaker-runtime", config=cfg)
+        # コントロールプレーンはエンドポイント確認にしか使わないため共有しない
+        cfg = _client_config(
+            self._request_config.read_timeout,
+            self._request_config.connect_timeout,
+        )
         self.sagemaker = self._sess.client("sagemaker", config=cfg)
         try:
             self.sagemaker.describe_endpoint(EndpointName=self.endpoint)[
@@ -166,60 +328,174 @@ class YomitokuClient:
             logger.error("Failed to describe endpoint %s: %s", self.endpoint, e)
             raise
 
+    def _open_circuit(self):
+        """サーキットをオープンする（_cb_lock取得済みで呼び出すこと）"""
+        self._circuit_state = "open"
+        self._circuit_open_until = now_ms() + self._circuit_cooldown * 1000
+        self._circuit_failures = 0
+        self._circuit_probing = False
+        logger.warning(
+            "Circuit OPEN for %ss (endpoint=%s)",
+            self._circuit_cooldown,
+            self.endpoint,
+        )
+
     def _record_success(self):
         with self._cb_lock:
             self._circuit_failures = 0
 
+            # 試行リクエストが成功したらクローズし、クールダウンを初期値に戻す
+            if self._circuit_state == "half_open":
+                self._circuit_state = "closed"
+                self._circuit_cooldown = self._circuit_config.cooldown_time
+                logger.info("Circuit CLOSED (endpoint=%s)", self.endpoint)
+
     def _record_failure(self):
         with self._cb_lock:
+            # 試行リクエストが失敗したらクールダウンを倍にして再オープン
+            if self._circuit_state == "half_open":
+                self._circuit_cooldown = min(
+                    self._circuit_cooldown * 2,
+                    self._circuit_config.max_cooldown_time,
+                )
+                self._open_circuit()
+                return
+
             # サーキットオープン中はカウントしない
-            if now_ms() < self._circuit_open_until:
+            if self._circuit_state == "open":
                 return
 
             self._circuit_failures += 1
 
             # 失敗回数が閾値を超えたらサーキットオープン
             if self._circuit_failures >= self._circuit_config.threshold:
-                self._circuit_open_until = (
-                    now_ms() + self._circuit_config.cooldown_time * 1000
-                )
-                self._circuit_failures = 0
-                logger.warning(
-                    "Circuit OPEN for %ss (endpoint=%s)",
-                    self._circuit_config.cooldown_time,
-                    self.endpoint,
-                )
+                self._open_circuit()
 
-    def _check_circuit(self):
-        """サーキットブレーカーの状態を確認。オープン中なら例外を投げ、リクエストを拒否する"""
+    def _record_latency(self, elapsed: float):
+        """成功したリクエストのレイテンシ（秒）を記録する
 
+        baselineは低下に素早く・上昇にゆっくり追従させ、平常時の値を保つ。
+        """
         with self._cb_lock:
-            if now_ms() < self._circuit_open_until:
-                remain = max(0, self._circuit_open_until - now_ms())
-                raise YomitokuInvokeError(
-                    f"Circuit open; retry after ~{remain // 1000}s",
-                )
+            self._latency_samples.append(elapsed)
+
+            if self._latency_baseline == 0.0:
+                self._latency_baseline = self._latency_current = elapsed
+                return
+
+            if elapsed < self._latency_baseline:
+                self._latency_baseline = (self._latency_baseline + 3 * elapsed) / 4
+            else:
+                self._latency_baseline = (self._latency_baseline * 99 + elapsed) / 100
+            self._latency_current = (elapsed + 3 * self._latency_current) / 4
+
+    def _total_timeout(self, num_pages: int, request_timeout: float | None) -> float:
+        """全ページ処理のタイムアウト（秒）を求める
+
+        1リクエストの所要時間は、十分なレイテンシの実測値があればp95から、
+        なければread_timeoutから見積もる。同時実行数はAIMDリミッターで
+        絞られた現在値を使い、再試行（バックオフを含む）の時間も見込む。
+        """
+        par = min(num_pages, max(1, self._limiter.target))
+        rounds = math.ceil(num_pages / par)
+
+        with self._cb_lock:
+            samples = list(self._latency_samples)
+
+        if len(samples) >= _LATENCY_MIN_SAMPLES:
+            p95 = statistics.quantiles(samples, n=20)[18]
+            per_request = p95 * 1.2
+            floor = 30.0
+        else:
+            per_request = (
+                request_timeout
+                if request_timeout is not None
+                else self._request_config.read_timeout
+            ) + 5
+            floor = 0.0
+
+        # 1.5倍の余裕はPDFのラスター化などinvoke以外の処理時間の分
+        retries = self._request_config.max_retries * (
+            per_request + self._request_config.backoff_max
+        )
+        return max(floor, per_request * rounds * 1.5 + retries)
+
+    def _latency_drop_ratio(self) -> float:
+        """レイテンシの悪化度合いからリクエストを間引く確率を求める"""
+        slow = 3 * self._latency_baseline
+        limit = 0.95 * self._request_config.read_timeout - slow
+        if self._latency_baseline == 0.0 or limit <= 0:
+            return 0.0
+
+        ratio = max(0.0, (self._latency_current - slow) / limit)
+        return min(ratio, 1.0) * _LATENCY_DROP_MAX
+
+    def _check_circuit(self) -> bool:
+        """サーキットブレーカーの状態を確認。オープン中なら例外を投げ、リクエストを拒否する
+
+        クールダウン経過後はhalf_openに移行し、試行リクエストを1件だけ通す。
+
+        Returns:
+            bool: このリクエストがhalf_open中の試行リクエストであればTrue
+        """
+
+        with self._cb_lock:
+            if self._circuit_state == "closed":
+                return False
+
+            now = now_ms()
+            if self._circuit_state == "open" and now >= self._circuit_open_until:
+                self._circuit_state = "half_open"
+                self._circuit_probing = False
+
+            if self._circuit_state == "half_open":
+                if self._circuit_probing:
+                    raise YomitokuInvokeError(
+                        "Circuit open; waiting for the probe request",
+                    )
+                self._circuit_probing = True
+                return True
+
+            remain = max(0, self._circuit_open_until - now)
+            raise YomitokuInvokeError(
+                f"Circuit open; retry after ~{remain // 1000}s",
+            )
+
+    def _shed_delay(self, prev: float) -> float | None:
+        """レイテンシの悪化度合いに応じて、リクエストを遅らせる時間（秒）を返す
+
+        エラーが出ていなくてもレイテンシが悪化していれば確率的に送信を遅らせ、
+        エンドポイントの負荷を下げる。遅らせない場合はNone。
+        """
+        with self._cb_lock:
+            if self._circuit_state != "closed":
+                return None
+            if random.random() >= self._latency_drop_ratio():  # noqa: S311
+                return None
+        return self._backoff(prev)
+
+    def _end_probe(self):
+        """試行リクエストの終了を記録（成否が判定されなかった場合は次の試行を許可）"""
+        with self._cb_lock:
+            self._circuit_probing = False
 
     def _invoke_one(self, payload):
-        self._check_circuit()
+        probe = self._check_circuit()
         try:
+            t0 = time.monotonic()
             resp = self.sagemaker_runtime.invoke_endpoint(
                 EndpointName=self.endpoint,
                 ContentType=payload.content_type,
                 Body=payload.body,
             )
-            raw = resp.get("Body").read()
-            text = (
-                raw.decode("utf-8", errors="replace")
-                if isinstance(raw, (bytes, bytearray))
-                else raw
-            )
-            data = json.loads(text)
+            # bytesのまま直接パース（orjsonが利用可能ならデコード不要）
+            data = json_loads(resp.get("Body").read())
             logger.info(
                 "%s [page %s] analyzed.",
                 payload.source_name,
                 payload.index,
             )
+            self._record_latency(time.monotonic() - t0)
             self._record_success()
             return InvokeResult(
                 index=payload.index,
@@ -234,7 +510,7 @@ class YomitokuClient:
             code = int(
                 e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) or 0,
             )
-            if code in (429, 500, 502, 503, 504):
+            if _is_retryable_client_error(e):
                 self._record_failure()
             raise YomitokuInvokeError(
                 f"SageMaker invoke failed ({code}) for page {payload.index}: {e}",
@@ -242,29 +518,112 @@ class YomitokuClient:
         except json.JSONDecodeError as e:
             self._record_failure()
             raise YomitokuInvokeError("Failed to decode JSON response") from e
-        except Exception as e:
-            # 予期しない例外は即座に再スロー（ここでサーキット状態を汚さない）
-            raise e
+        # 予期しない例外はそのまま送出される（ここでサーキット状態を汚さない）
+        finally:
+            if probe:
+                self._end_probe()
+
+    def _retry_delay(
+        self,
+        error: YomitokuInvokeError,
+        prev: float,
+        attempt: int = 0,
+    ) -> float | None:
+        """再試行までの待ち時間（秒）を返す。再試行すべきでないエラーならNone
+
+        待ち時間はdecorrelated jitter（前回の待ち時間をもとに乱択）で決め、
+        同時に失敗した複数ページの再試行が同じタイミングに揃わないようにする。
+        """
+        cause = error.__cause__
+        if isinstance(cause, ClientError):
+            # ValidationErrorやModelErrorなど恒久的なエラーは即座に失敗させる
+            if not _is_retryable_client_error(cause):
+                return None
+
+            metadata = cause.response.get("ResponseMetadata", {})
+
+            # サーバーからRetry-Afterが返っていればそれに従う
+            retry_after = metadata.get("HTTPHeaders", {}).get("retry-after")
+            if retry_after is not None:
+                try:
+                    return min(float(retry_after), self._request_config.backoff_max)
+                except ValueError:
+                    pass  # HTTP-date形式は通常のバックオフで扱う
+        elif isinstance(cause, json.JSONDecodeError):
+            # レスポンスが途中で切れた可能性があるため、1回だけ再試行する
+            if attempt > 0:
+                return None
+        elif not isinstance(cause, _RETRYABLE_BOTO_ERRORS):
+            # サーキットオープンや恒久的なSDKエラーは再試行しない
+            return None
+
+        return self._backoff(prev)
+
+    def _backoff(self, prev: float) -> float:
+        """前回の待ち時間からdecorrelated jitterで次の待ち時間（秒）を決める"""
+        base = self._request_config.backoff_base
+        delay = random.uniform(base, max(base, prev * 3))  # noqa: S311
+        return min(delay, self._request_config.backoff_max)
 
     async def _ainvoke_one(
         self,
         payload: PagePayload,
         request_timeout: float | None = None,
     ):
-        fut = self._loop.run_in_executor(self._pool, self._invoke_one, payload)
         timeout = (
             request_timeout
             if request_timeout is not None
             else (self._request_config.read_timeout + 5)
         )
+        max_retries = self._request_config.max_retries
+        delay = self._request_config.backoff_base
 
-        try:
-            return await asyncio.wait_for(fut, timeout=timeout)
-        except asyncio.TimeoutError as e:
-            self._record_failure()
-            raise YomitokuInvokeError(
-                f"Request timeout for page {payload.index} (>{timeout}s)",
-            ) from e
+        for attempt in range(max_retries + 1):
+            # レイテンシ悪化時は送信を遅らせる（再試行回数には数えない）
+            while (shed := self._shed_delay(delay)) is not None:
+                logger.warning(
+                    "Delaying page %s by %.2fs; endpoint latency is degraded",
+                    payload.index,
+                    shed,
+                )
+                delay = shed
+                await asyncio.sleep(shed)
+
+            # 実行中のループで直接スケジュール（contextのコピーやpartialを挟まない）
+            loop = asyncio.get_running_loop()
+            fut = loop.run_in_executor(self._pool, self._invoke_one, payload)
+
+            try:
+                result = await asyncio.wait_for(fut, timeout=timeout)
+            except asyncio.TimeoutError as e:
+                self._record_failure()
+                self._limiter.on_failure()
+                raise YomitokuInvokeError(
+                    f"Request timeout for page {payload.index} (>{timeout}s)",
+                ) from e
+            except YomitokuInvokeError as e:
+                delay = self._retry_delay(e, delay, attempt)
+                if delay is None:
+                    raise
+
+                # 過負荷の兆候なので同時実行数を絞る
+                self._limiter.on_failure()
+                if attempt >= max_retries:
+                    raise
+
+                # バックオフ中はワーカースレッドを解放し、イベントループ上で待機
+                logger.warning(
+                    "Retrying page %s in %.2fs (%s/%s): %s",
+                    payload.index,
+                    delay,
+                    attempt + 1,
+                    max_retries,
+                    e,
+                )
+                await asyncio.sleep(delay)
+            else:
+                self._limiter.on_success()
+                return result
 
     async def analyze_async(
         self,
@@ -276,65 +635,94 @@ class YomitokuClient:
     ):
         # 画像データ読み込み
         content_type = guess_content_type(path_img)
-        img_bytes, content_type = load_image_bytes(path_img, content_type, dpi)
-        page_index = make_page_index(page_index, len(img_bytes))
-
-        # 全ページ処理のタイムアウト設定
-        if total_timeout is None:
-            par = min(len(page_index), max(1, self._pool._max_workers))
-            base = (
-                request_timeout
-                if request_timeout is not None
-                else self._request_config.read_timeout
-            ) + 5
-            total_timeout = base * math.ceil(len(page_index) / par) * 1.5
-
-        # ページごとのペイロード作成
-        payloads = [
-            PagePayload(
-                index=i,
-                content_type=content_type,
-                body=b,
-                source_name=os.path.basename(path_img),
-            )
-            for i, b in enumerate(img_bytes)
-            if i in page_index
-        ]
-
-        par = min(len(payloads), max(1, self._pool._max_workers))
-        sem = asyncio.Semaphore(par)
-
-        async def run_one(payload):
-            async with sem:
-                return await self._ainvoke_one(payload, request_timeout)
-
-        tasks = [asyncio.create_task(run_one(payload)) for payload in payloads]
+        source_name = os.path.basename(path_img)
+        loop = asyncio.get_running_loop()
+        doc = None
 
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks),
-                timeout=total_timeout,
-            )
-        except asyncio.TimeoutError as e:
-            for t in tasks:
-                if not t.done():
-                    t.cancel()
-            self._record_failure()
-            raise YomitokuInvokeError(f"Analyze timeout (> {total_timeout}s)") from e
-        except Exception as e:
-            for t in tasks:
-                if not t.done():
-                    t.cancel()
-            logger.exception("Analyze failed: %s", path_img)
-            raise YomitokuInvokeError(f"Analyze failed for {path_img}") from e
+            if content_type == "application/pdf":
+                # PDFは一度だけ開き、ラスター化はページごとにスレッドプールで実行
+                # （ラスター化できたページから順にinvokeし、CPU処理と通信を重ねる）
+                doc = await asyncio.to_thread(open_pdf, path_img)
+                # pdfiumはスレッドセーフではないため、ドキュメントへの操作は直列化する
+                render_lock = threading.Lock()
+                num_pages = len(doc)
+                page_index = make_page_index(page_index, num_pages)
+                # 指定ページだけを対象にし、範囲外のページ番号は無視する
+                pages = [
+                    (i, None)
+                    for i in sorted(frozenset(page_index))
+                    if 0 <= i < num_pages
+                ]
+                # NOTE: PDFはページ分割・ラスター化してPNG化。以降のinvokeはimage/pngで送る
+                content_type = "image/png"
+            else:
+                img_bytes, content_type = load_image_bytes(path_img, content_type, dpi)
+                page_index = make_page_index(page_index, len(img_bytes))
+                page_index_set = frozenset(page_index)  # 所属判定をO(1)にする
+                pages = [(i, b) for i, b in enumerate(img_bytes) if i in page_index_set]
+
+            # 全ページ処理のタイムアウト設定
+            if total_timeout is None:
+                total_timeout = self._total_timeout(len(page_index), request_timeout)
+
+            async def run_one(index: int, body: bytes | None):
+                if body is None:
+                    body = await loop.run_in_executor(
+                        self._pool,
+                        render_pdf_page_to_bytes,
+                        doc,
+                        index,
+                        dpi,
+                        render_lock,
+                    )
+
+                # ページごとのペイロード作成
+                payload = PagePayload(
+                    index=index,
+                    content_type=content_type,
+                    body=body,
+                    source_name=source_name,
+                )
 
-        if not results:
-            raise YomitokuInvokeError("No page results were returned.")
+                # 同時実行数はAIMDリミッターで制御（失敗時に自動で絞り込む）
+                async with self._limiter:
+                    return await self._ainvoke_one(payload, request_timeout)
 
-        # ページ順に整列
-        results.sort(key=lambda r: r.index)
-        merged_dict = _merge_results(results)
-        return merged_dict
+            tasks = [asyncio.create_task(run_one(i, b)) for i, b in pages]
+
+            try:
+                results = await asyncio.wait_for(
+                    asyncio.gather(*tasks),
+                    timeout=total_timeout,
+                )
+            except asyncio.TimeoutError as e:
+                for t in tasks:
+                    if not t.done():
+                        t.cancel()
+                self._record_failure()
+                raise YomitokuInvokeError(
+                    f"Analyze timeout (> {total_timeout}s)"
+                ) from e
+            except Exception as e:
+                for t in tasks:
+                    if not t.done():
+                        t.cancel()
+                logger.exception("Analyze failed: %s", path_img)
+                raise YomitokuInvokeError(f"Analyze failed for {path_img}") from e
+
+            if not results:
+                raise YomitokuInvokeError("No page results were returned.")
+
+            # ページ順に整列
+            results.sort(key=lambda r: r.index)
+            merged_dict = _merge_results(results)
+            return merged_dict
+        finally:
+            if doc is not None:
+                # 実行中のラスター化が終わるのを待ってから閉じる
+                with render_lock:
+                    doc.close()
 
     async def analyze_batch_async(
         self,
@@ -363,8 +751,8 @@ class YomitokuClient:
         async def log_record(record: dict):
             """ログをJSON Lines形式で追記"""
             async with log_lock:
-                with open(log_path, "a", encoding="utf-8") as lf:
-                    lf.write(json.dumps(record, ensure_ascii=False) + "\n")
+                with open(log_path, "ab") as lf:
+                    lf.write(json_dumps(record) + b"\n")
 
         async def process_one(path_img: str):
             ext = Path(path_img).suffix.lower().replace(".", "")
@@ -398,8 +786,11 @@ class YomitokuClient:
                     request_timeout=request_timeout,
                     total_timeout=total_timeout,
                 )
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(result, f, ensure_ascii=False, indent=2)
+                # UTF-8のbytesとして直接書き出す（テキスト層を経由しない）
+                await asyncio.to_thread(
+                    output_path.write_bytes,
+                    json_dumps(result, indent=True),
+                )
                 logger.info("Saved: %s", output_path.name)
                 record["success"] = True
             except Exception as e:
@@ -409,13 +800,17 @@ class YomitokuClient:
             finally:
                 await log_record(record)
 
-        sem = asyncio.Semaphore(self._pool._max_workers)
+        # ファイルごとにタスクを作ってセマフォで待たせるのではなく、
+        # 固定数のワーカーが同じイテレータから順に取り出して処理する
+        # （ページ単位の同時実行数はanalyze_async内のリミッターで制御）
+        queue = iter(path_imgs)
 
-        async def run_with_limit(path_img):
-            async with sem:
+        async def worker():
+            for path_img in queue:
                 await process_one(path_img)
 
-        await asyncio.gather(*(run_with_limit(p) for p in path_imgs))
+        concurrency = max(1, min(self._max_workers, len(path_imgs)))
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
 
     def analyze(
         self,
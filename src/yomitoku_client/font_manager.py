@@ -2,10 +2,18 @@
 Font Manager - Manages built-in fonts for PDF generation
 """
 
+import atexit
 import os
-from pathlib import Path
+from contextlib import ExitStack
+from functools import lru_cache
+from importlib import resources
 
+# Keep resources extracted from a zipped install until the process exits
+_resource_stack = ExitStack()
+atexit.register(_resource_stack.close)
 
+
+@lru_cache(maxsize=1)
 def get_default_font_path() -> str:
     """
     Get the path to the default built-in font
@@ -13,10 +21,8 @@ def get_default_font_path() -> str:
     Returns:
         str: Path to the built-in font
     """
-    # Get the directory where this module is located
-    module_dir = Path(__file__).parent
-    resource_dir = module_dir / "resource"
-    font_path = resource_dir / "MPLUS1p-Medium.ttf"
+    ref = resources.files("yomitoku_client").joinpath("resource/MPLUS1p-Medium.ttf")
+    font_path = _resource_stack.enter_context(resources.as_file(ref))
 
     if not font_path.exists():
         raise FileNotFoundError(
@@ -1,6 +1,8 @@
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import cv2
@@ -8,8 +10,13 @@ import pypdfium2 as pdfium
 from PIL import Image
 from pydantic import BaseModel, Field
 
-from .utils import load_image, load_pdf, make_page_index
-from .visualizers.document_visualizer import DocumentVisualizer
+from .utils import (
+    json_dumps,
+    load_image,
+    load_pdf,
+    make_page_index,
+    map_in_threads,
+)
 
 
 def merge_pdf_packets_to_file(packets, out_path):
@@ -42,6 +49,105 @@ def correct_rotation_image(
     return img
 
 
+@cache
+def _renderer_factory():
+    """Import the renderer factory once, on first use (renderers import this module)"""
+    from .renderers.factory import RendererFactory
+
+    return RendererFactory
+
+
+def _write_json(path: str, obj: Any, encoding: str) -> None:
+    """Write an object as indented JSON, skipping the text layer for UTF-8"""
+    data = json_dumps(obj, indent=True)
+    if encoding.lower().replace("-", "").replace("_", "") == "utf8":
+        with open(path, "wb") as f:
+            f.write(data)
+    else:
+        with open(path, "w", encoding=encoding) as f:
+            f.write(data.decode("utf-8"))
+
+
+def _write_text(path: str, content: str, encoding: str) -> None:
+    with open(path, "w", encoding=encoding) as f:
+        f.write(content)
+
+
+def _write_bytes(path: str, content: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _load_page_images(image_path: str, page_index, dpi: int):
+    """
+    Load the images of the selected pages, indexable by page index
+
+    For PDFs only the selected pages are rasterized.
+    """
+    _basename, ext = os.path.splitext(os.path.basename(image_path))
+    if ext.lower() == ".pdf":
+        page_index = list(page_index)
+        return dict(
+            zip(
+                page_index,
+                load_pdf(image_path, dpi=dpi, pages=page_index),
+                strict=True,
+            )
+        )
+    return load_image(image_path)
+
+
+def _call_page(method: str, page, kwargs: dict):
+    return getattr(page, method)(**kwargs)
+
+
+def _map_pages(
+    method: str,
+    pages: list,
+    page_kwargs: list[dict],
+    max_workers: int | None = None,
+) -> list:
+    """
+    Call a DocumentResult method on each page, keeping the page order
+
+    Args:
+        method: Name of the DocumentResult method to call
+        pages: Pages to process
+        page_kwargs: Keyword arguments for each page
+        max_workers: Number of threads to render pages in parallel.
+            If None or 1, pages are rendered in the current thread
+
+    Returns:
+        list: Return values of the method for each page
+    """
+    call = partial(_call_page, method)
+    # ページごとの変換は独立しているため、複数ページはスレッド並列で処理
+    if max_workers is not None and max_workers > 1:
+        return map_in_threads(call, pages, page_kwargs, max_workers=max_workers)
+
+    return list(map(call, pages, page_kwargs))
+
+
+def _draw_page(page, img, mode):
+    """Correct the page rotation and draw the visualization"""
+    corrected_img = correct_rotation_image(
+        img,
+        angle=page.preprocess.get("angle", 0),
+    )
+
+    return page.visualize(
+        corrected_img,
+        mode=mode,
+    )
+
+
+def _visualize_page(page, img, path_output, mode):
+    """Visualize a single page and save the image"""
+    visualize_img = _draw_page(page, img, mode)
+    cv2.imwrite(path_output, visualize_img)
+    return visualize_img
+
+
 class Paragraph(BaseModel):
     """Paragraph data model"""
 
@@ -138,11 +244,9 @@ class DocumentResult(BaseModel):
             str: Markdown formatted text
         """
 
-        # Dynamic import to avoid circular imports
-        from .renderers.markdown_renderer import MarkdownRenderer
-
-        # Create MarkdownRenderer instance
-        renderer = MarkdownRenderer(
+        # Get shared MarkdownRenderer instance
+        renderer = _renderer_factory().get_renderer(
+            "markdown",
             ignore_line_break=ignore_line_break,
             export_figure=export_figure,
             export_figure_letter=export_figure_letter,
@@ -179,11 +283,9 @@ class DocumentResult(BaseModel):
             str: HTML formatted text
         """
 
-        # Dynamic import to avoid circular imports
-        from .renderers.html_renderer import HTMLRenderer
-
-        # Create HTMLRenderer instance
-        renderer = HTMLRenderer(
+        # Get shared HTMLRenderer instance
+        renderer = _renderer_factory().get_renderer(
+            "html",
             ignore_line_break=ignore_line_break,
             export_figure=export_figure,
             export_figure_letter=export_figure_letter,
@@ -221,11 +323,9 @@ class DocumentResult(BaseModel):
             str: CSV formatted text
         """
 
-        # Dynamic import to avoid circular imports
-        from .renderers.csv_renderer import CSVRenderer
-
-        # Create CSVRenderer instance
-        renderer = CSVRenderer(
+        # Get shared CSVRenderer instance
+        renderer = _renderer_factory().get_renderer(
+            "csv",
             ignore_line_break=ignore_line_break,
             export_figure=export_figure,
             export_figure_letter=export_figure_letter,
@@ -253,11 +353,9 @@ class DocumentResult(BaseModel):
             str: JSON formatted text
         """
 
-        # Dynamic import to avoid circular imports
-        from .renderers.json_renderer import JSONRenderer
-
-        # Create JSONRenderer instance
-        renderer = JSONRenderer(
+        # Get shared JSONRenderer instance
+        renderer = _renderer_factory().get_renderer(
+            "json",
             ignore_line_break=ignore_line_break,
             export_figure=export_figure,
             figure_dir=figure_dir,
@@ -280,11 +378,8 @@ class DocumentResult(BaseModel):
             str: Path to generated PDF file
         """
 
-        # Dynamic import to avoid circular imports
-        from .renderers.pdf_renderer import PDFRenderer
-
-        # Create PDFRenderer instance
-        renderer = PDFRenderer(font_path=font_path)
+        # Get shared PDFRenderer instance
+        renderer = _renderer_factory().get_renderer("pdf", font_path=font_path)
         return renderer.render(
             self,
             img=img,
@@ -306,13 +401,13 @@ class DocumentResult(BaseModel):
         Returns:
             np.ndarray: Image array with visualizations
         """
+        # 描画系の依存 (PIL.ImageDraw 等) は初回の可視化時まで読み込まない
+        from .visualizers.document_visualizer import DocumentVisualizer
+
         # Create DocumentVisualizer instance
         visualizer = DocumentVisualizer()
 
         # Visualize the document layout
-        # Use types.SimpleNamespace for a cleaner approach
-        from types import SimpleNamespace
-
         results = SimpleNamespace(
             paragraphs=self.paragraphs,
             tables=self.tables,
@@ -337,6 +432,27 @@ class MultiPageDocumentResult(BaseModel):
         description="Dictionary of page index to DocumentResult",
     )
 
+    def load_page_images(
+        self,
+        image_path: str | Path,
+        page_index: list = None,
+        dpi: int = 200,
+    ):
+        """
+        Load the page images of the original file once, to share across exports
+
+        Args:
+            image_path: Path to the original image/PDF file
+            page_index: Page index to load. If None, all pages are loaded
+            dpi: DPI for loading PDF pages as images
+
+        Returns:
+            Page images indexable by page index, to pass as `images` to
+            to_html, to_markdown, to_pdf and visualize
+        """
+        page_index = make_page_index(page_index, len(self.pages))
+        return _load_page_images(image_path, page_index, dpi)
+
     def to_pdf(
         self,
         image_path: str | Path,
@@ -345,6 +461,8 @@ class MultiPageDocumentResult(BaseModel):
         font_path: str | None = None,
         dpi: int = 200,
         mode="combine",
+        max_workers: int | None = None,
+        images=None,
     ) -> str:
         """
         Convert multi-page document result to PDF format
@@ -356,6 +474,10 @@ class MultiPageDocumentResult(BaseModel):
             image_path: Path to the original image/PDF file for searchable PDF generation
             dpi: DPI for loading PDF pages as images
             mode: 'combine' to combine all pages into one file, 'separate' to save each page separately
+            max_workers: Number of threads to render pages in parallel.
+                If None or 1, pages are rendered in the current thread
+            images: Page images already loaded with load_page_images.
+                If given, image_path is not read again
         """
 
         page_index = make_page_index(page_index, len(self.pages))
@@ -364,29 +486,32 @@ class MultiPageDocumentResult(BaseModel):
         if base_dir:
             os.makedirs(base_dir, exist_ok=True)
 
-        if image_path is not None:
-            basename, ext = os.path.splitext(os.path.basename(image_path))
-            if ext.lower() == ".pdf":
-                images = load_pdf(image_path, dpi=dpi)
-            else:
-                images = load_image(image_path)
+        if images is None and image_path is not None:
+            images = _load_page_images(image_path, page_index, dpi)
 
-        results = []
+        page_kwargs = []
         for idx in page_index:
             corrected_img = None
-            if image_path is not None:
+            if images is not None:
                 corrected_img = correct_rotation_image(
                     images[idx],
                     angle=self.pages[idx].preprocess.get("angle", 0),
                 )
 
-            results.append(
-                self.pages[idx].to_pdf(
-                    img=Image.fromarray(corrected_img[:, :, ::-1]),
-                    font_path=font_path,
-                ),
+            page_kwargs.append(
+                {
+                    "img": Image.fromarray(corrected_img[:, :, ::-1]),
+                    "font_path": font_path,
+                },
             )
 
+        results = _map_pages(
+            "to_pdf",
+            [self.pages[idx] for idx in page_index],
+            page_kwargs,
+            max_workers,
+        )
+
         base_name, ext = os.path.splitext(output_path)
         if mode == "combine":
             merge_pdf_packets_to_file(
@@ -394,10 +519,11 @@ class MultiPageDocumentResult(BaseModel):
                 out_path=output_path,
             )
         elif mode == "separate":
-            for i, content in zip(page_index, results, strict=True):
-                page_output_path = f"{base_name}_page_{i}{ext}"
-                with open(page_output_path, "wb") as f:
-                    f.write(content.getvalue())
+            map_in_threads(
+                _write_bytes,
+                [f"{base_name}_page_{i}{ext}" for i in page_index],
+                [content.getvalue() for content in results],
+            )
 
     def export_file(
         self,
@@ -421,33 +547,22 @@ class MultiPageDocumentResult(BaseModel):
         base_name, ext = os.path.splitext(output_path)
         if mode == "combine":
             if ext == ".json":
-                with open(output_path, "w", encoding=encoding) as f:
-                    json.dump(
-                        results,
-                        f,
-                        ensure_ascii=False,
-                        indent=2,
-                    )
+                _write_json(output_path, results, encoding)
             else:
-                combined_content = "\n".join(results)
+                # 連結した巨大な文字列を作らず、ページごとに逐次書き込む
                 with open(output_path, "w", encoding=encoding) as f:
-                    f.write(combined_content)
+                    for j, content in enumerate(results):
+                        if j:
+                            f.write("\n")
+                        f.write(content)
 
         elif mode == "separate":
-            for i, content in zip(page_index, results, strict=True):
-                page_output_path = f"{base_name}_page_{i}{ext}"
-
-                if ext == ".json":
-                    with open(page_output_path, "w", encoding=encoding) as f:
-                        json.dump(
-                            content,
-                            f,
-                            ensure_ascii=False,
-                            indent=2,
-                        )
-                else:
-                    with open(page_output_path, "w", encoding=encoding) as f:
-                        f.write(content)
+            write = _write_json if ext == ".json" else _write_text
+            map_in_threads(
+                partial(write, encoding=encoding),
+                [f"{base_name}_page_{i}{ext}" for i in page_index],
+                results,
+            )
 
     def to_csv(
         self,
@@ -455,6 +570,7 @@ class MultiPageDocumentResult(BaseModel):
         encoding: str = "utf-8",
         mode="combine",
         page_index: list = None,
+        max_workers: int | None = None,
         **kwargs,
     ) -> None:
         """
@@ -465,6 +581,8 @@ class MultiPageDocumentResult(BaseModel):
             page_index: Page index to convert
             encoding: File encoding
             mode: 'combine' to combine all pages into one file, 'separate' to save each page separately
+            max_workers: Number of threads to render pages in parallel.
+                If None or 1, pages are rendered in the current thread
         """
         page_index = make_page_index(page_index, len(self.pages))
 
@@ -472,9 +590,12 @@ class MultiPageDocumentResult(BaseModel):
         if base_dir:
             os.makedirs(base_dir, exist_ok=True)
 
-        results = []
-        for idx in page_index:
-            results.append(self.pages[idx].to_csv(**kwargs))
+        results = _map_pages(
+            "to_csv",
+            [self.pages[idx] for idx in page_index],
+            [kwargs] * len(page_index),
+            max_workers,
+        )
 
         self.export_file(
             results,
@@ -494,6 +615,8 @@ class MultiPageDocumentResult(BaseModel):
         page_index: list = None,
         image_path: str | Path | None = None,
         dpi: int = 200,
+        max_workers: int | None = None,
+        images=None,
         **kwargs,
     ) -> None:
         """
@@ -506,6 +629,10 @@ class MultiPageDocumentResult(BaseModel):
             page_index: List of page indices to process
             image_path: Path to the original image/PDF file for image extraction
             dpi: DPI for loading PDF pages as images
+            max_workers: Number of threads to render pages in parallel.
+                If None or 1, pages are rendered in the current thread
+            images: Page images already loaded with load_page_images.
+                If given, image_path is not read again
         """
         page_index = make_page_index(page_index, len(self.pages))
 
@@ -513,16 +640,12 @@ class MultiPageDocumentResult(BaseModel):
         if base_dir:
             os.makedirs(base_dir, exist_ok=True)
 
-        if image_path is not None:
-            basename, ext = os.path.splitext(os.path.basename(image_path))
-            if ext.lower() == ".pdf":
-                images = load_pdf(image_path, dpi=dpi)
-            else:
-                images = load_image(image_path)
+        if images is None and image_path is not None:
+            images = _load_page_images(image_path, page_index, dpi)
 
-        results = []
+        page_kwargs = []
         for idx in page_index:
-            if image_path is not None:
+            if images is not None:
                 corrected_img = correct_rotation_image(
                     images[idx],
                     angle=self.pages[idx].preprocess.get("angle", 0),
@@ -530,14 +653,17 @@ class MultiPageDocumentResult(BaseModel):
             else:
                 corrected_img = None
 
-            results.append(
-                self.pages[idx].to_html(
-                    **kwargs,
-                    img=corrected_img,
-                    output_path=output_path,
-                ),
+            page_kwargs.append(
+                {**kwargs, "img": corrected_img, "output_path": output_path},
             )
 
+        results = _map_pages(
+            "to_html",
+            [self.pages[idx] for idx in page_index],
+            page_kwargs,
+            max_workers,
+        )
+
         self.export_file(
             results,
             output_path=output_path,
@@ -556,6 +682,8 @@ class MultiPageDocumentResult(BaseModel):
         page_index: list = None,
         image_path: str | Path | None = None,
         dpi: int = 200,
+        max_workers: int | None = None,
+        images=None,
         **kwargs,
     ) -> None:
         """
@@ -568,6 +696,10 @@ class MultiPageDocumentResult(BaseModel):
             page_index: List of page indices to process
             image_path: Path to the original image/PDF file for image extraction
             dpi: DPI for loading PDF pages as images
+            max_workers: Number of threads to render pages in parallel.
+                If None or 1, pages are rendered in the current thread
+            images: Page images already loaded with load_page_images.
+                If given, image_path is not read again
         """
 
         page_index = make_page_index(page_index, len(self.pages))
@@ -576,30 +708,29 @@ class MultiPageDocumentResult(BaseModel):
         if base_dir:
             os.makedirs(base_dir, exist_ok=True)
 
-        if image_path is not None:
-            basename, ext = os.path.splitext(os.path.basename(image_path))
-            if ext.lower() == ".pdf":
-                images = load_pdf(image_path, dpi=dpi)
-            else:
-                images = load_image(image_path)
+        if images is None and image_path is not None:
+            images = _load_page_images(image_path, page_index, dpi)
 
-        results = []
+        page_kwargs = []
         for idx in page_index:
             corrected_img = None
-            if image_path is not None:
+            if images is not None:
                 corrected_img = correct_rotation_image(
                     images[idx],
                     angle=self.pages[idx].preprocess.get("angle", 0),
                 )
 
-            results.append(
-                self.pages[idx].to_markdown(
-                    img=corrected_img,
-                    output_path=output_path,
-                    **kwargs,
-                ),
+            page_kwargs.append(
+                {"img": corrected_img, "output_path": output_path, **kwargs},
             )
 
+        results = _map_pages(
+            "to_markdown",
+            [self.pages[idx] for idx in page_index],
+            page_kwargs,
+            max_workers,
+        )
+
         self.export_file(
             results,
             output_path=output_path,
@@ -616,6 +747,7 @@ class MultiPageDocumentResult(BaseModel):
         encoding: str = "utf-8",
         mode="combine",
         page_index: list = None,
+        max_workers: int | None = None,
         **kwargs,
     ) -> None:
         """
@@ -628,6 +760,8 @@ class MultiPageDocumentResult(BaseModel):
             page_index: List of page indices to process
             image_path: Path to the original image/PDF file for image extraction
             dpi: DPI for loading PDF pages as images
+            max_workers: Number of threads to render pages in parallel.
+                If None or 1, pages are rendered in the current thread
         """
 
         base_dir = os.path.dirname(output_path)
@@ -636,9 +770,12 @@ class MultiPageDocumentResult(BaseModel):
 
         page_index = make_page_index(page_index, len(self.pages))
 
-        results = []
-        for idx in page_index:
-            results.append(self.pages[idx].to_json(**kwargs))
+        results = _map_pages(
+            "to_json",
+            [self.pages[idx] for idx in page_index],
+            [kwargs] * len(page_index),
+            max_workers,
+        )
 
         self.export_file(
             results,
@@ -657,6 +794,8 @@ class MultiPageDocumentResult(BaseModel):
         output_directory: str | None = None,
         page_index: list = None,
         dpi: int = 200,
+        max_workers: int | None = None,
+        images=None,
     ) -> Any:
         """
         Visualize the document result
@@ -667,6 +806,10 @@ class MultiPageDocumentResult(BaseModel):
             output_directory: Directory to save visualized images
             page_index: List of page indices to visualize
             dpi: DPI for loading PDF pages as images
+            max_workers: Number of threads to render pages in parallel.
+                If None or 1, pages are rendered in the current thread
+            images: Page images already loaded with load_page_images.
+                If given, image_path is only used to name the output files
         """
 
         page_index = make_page_index(page_index, len(self.pages))
@@ -674,32 +817,43 @@ class MultiPageDocumentResult(BaseModel):
         if output_directory is not None:
             os.makedirs(output_directory, exist_ok=True)
 
-        basename, ext = os.path.splitext(os.path.basename(image_path))
-        if ext.lower() == ".pdf":
-            images = load_pdf(image_path, dpi=dpi)
-        else:
-            images = load_image(image_path)
+        if images is None:
+            images = _load_page_images(image_path, page_index, dpi)
 
         basename, _ext = os.path.splitext(os.path.basename(image_path))
-
-        visualize_imgs = []
-        for index in page_index:
-            corrected_img = correct_rotation_image(
-                images[index],
-                angle=self.pages[index].preprocess.get("angle", 0),
-            )
-
-            visualize_img = self.pages[index].visualize(
-                corrected_img,
-                mode=mode,
+        if output_directory is not None:
+            basename = os.path.join(output_directory, basename)
+
+        pages = [self.pages[index] for index in page_index]
+        page_images = [images[index] for index in page_index]
+
+        # 出力パスの接頭辞は一度だけ組み立て、ページごとには添字のみ付与する
+        path_outputs = [f"{basename}_{mode}_page_{index}.jpg" for index in page_index]
+
+        # ページごとの描画は独立しているため、複数ページはスレッド並列で処理
+        # (cv2 は描画・エンコード中 GIL を解放する)
+        if max_workers is not None and max_workers > 1:
+            return map_in_threads(
+                partial(_visualize_page, mode=mode),
+                pages,
+                page_images,
+                path_outputs,
+                max_workers=max_workers,
             )
 
-            path_output = basename + f"_{mode}_page_{index}.jpg"
-
-            if output_directory is not None:
-                path_output = os.path.join(output_directory, path_output)
-
-            cv2.imwrite(path_output, visualize_img)
-            visualize_imgs.append(visualize_img)
+        # 逐次描画では JPEG のエンコードと書き込みをスレッドに逃がし、
+        # 次ページの描画と重ねる (cv2 は処理中 GIL を解放する)
+        results = []
+        with ThreadPoolExecutor(max_workers=4) as writer:
+            futures = []
+            for page, img, path_output in zip(
+                pages, page_images, path_outputs, strict=True
+            ):
+                visualize_img = _draw_page(page, img, mode)
+                futures.append(writer.submit(cv2.imwrite, path_output, visualize_img))
+                results.append(visualize_img)
+
+            for future in futures:
+                future.result()
 
-        return visualize_imgs
+        return results
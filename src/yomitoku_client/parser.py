@@ -5,15 +5,94 @@ SageMaker Parser - For parsing SageMaker YomiToku API outputs
 from typing import Any
 
 from .exceptions import DocumentAnalysisError, ValidationError
-from .models import DocumentResult, MultiPageDocumentResult
+from .models import (
+    DocumentResult,
+    Figure,
+    MultiPageDocumentResult,
+    Paragraph,
+    Table,
+    TableCell,
+    Word,
+)
+from .utils import json_loads
 
 
-def parse_pydantic_model(data: dict[str, Any]) -> MultiPageDocumentResult:
+def _construct_paragraph(data: dict[str, Any] | None) -> Paragraph | None:
+    if data is None:
+        return None
+    return Paragraph.model_construct(**data)
+
+
+def _build_paragraphs(raw_list: list[dict[str, Any]]) -> list[Paragraph]:
+    construct = Paragraph.model_construct
+    return [construct(**p) for p in raw_list]
+
+
+def _build_cells(raw_list: list[dict[str, Any]]) -> list[TableCell]:
+    construct = TableCell.model_construct
+    return [construct(**c) for c in raw_list]
+
+
+def _build_words(raw_list: list[dict[str, Any]]) -> list[Word]:
+    construct = Word.model_construct
+    return [construct(**w) for w in raw_list]
+
+
+def _construct_document(data: dict[str, Any]) -> DocumentResult:
+    """
+    Build a DocumentResult (and its nested models) without validation
+
+    Args:
+        data: Page result dictionary that already follows the output schema
+
+    Returns:
+        DocumentResult: Document result for the page
+    """
+    tables = [
+        Table.model_construct(
+            **{
+                **table,
+                "cells": _build_cells(table.get("cells", [])),
+                "caption": _construct_paragraph(table.get("caption")),
+            },
+        )
+        for table in data.get("tables", [])
+    ]
+    figures = [
+        Figure.model_construct(
+            **{
+                **figure,
+                "paragraphs": _build_paragraphs(figure.get("paragraphs", [])),
+                "caption": _construct_paragraph(figure.get("caption")),
+            },
+        )
+        for figure in data.get("figures", [])
+    ]
+
+    return DocumentResult.model_construct(
+        **{
+            **data,
+            "paragraphs": _build_paragraphs(data.get("paragraphs", [])),
+            "tables": tables,
+            "figures": figures,
+            "words": _build_words(data.get("words", [])),
+        },
+    )
+
+
+def parse_pydantic_model(
+    data: dict[str, Any] | str | bytes,
+    validate: bool = True,
+) -> MultiPageDocumentResult:
     """
     Parse dictionary data from SageMaker output
 
     Args:
-        data: Dictionary from SageMaker
+        data: Dictionary from SageMaker, or the raw JSON document as str or
+            UTF-8 encoded bytes
+        validate: Whether to validate every field with pydantic. Pass False
+            only for trusted data that already follows the output schema
+            (e.g. a result produced in the same process) to skip validation
 
     Returns:
         MultiPageDocumentResult: Multi-page document result containing all pages
@@ -23,6 +102,9 @@ def parse_pydantic_model(data: dict[str, Any]) -> MultiPageDocumentResult:
         DocumentAnalysisError: If parsing fails
     """
     try:
+        if isinstance(data, str | bytes | bytearray):
+            data = json_loads(data)
+
         if "result" not in data or not data["result"]:
             raise ValidationError(
                 "Invalid SageMaker output format: missing 'result' field",
@@ -32,14 +114,14 @@ def parse_pydantic_model(data: dict[str, Any]) -> MultiPageDocumentResult:
         if isinstance(data["result"], list):
             if len(data["result"]) == 0:
                 raise ValidationError("Empty result list")
-            # Create pages from all results
-            pages = [
-                DocumentResult(**result_data)
-                for i, result_data in enumerate(data["result"])
-            ]
+            results = data["result"]
         else:
             # Single result, create single page
-            pages = [DocumentResult(**data["result"])]
+            results = [data["result"]]
+
+        # Create pages from all results
+        build = DocumentResult.model_validate if validate else _construct_document
+        pages = [build(result_data) for result_data in results]
 
         pages = {page.num_page: page for page in pages}
 
@@ -3,10 +3,12 @@ CSV Renderer - For converting document data to CSV format
 """
 
 import csv
+import io
+from collections.abc import Iterable
 from typing import Any
 
 from ..models import DocumentResult, Paragraph, Table
-from ..utils import table_to_csv
+from ..utils import convert_table_array, merge_by_order
 from .base import BaseRenderer
 
 
@@ -52,65 +54,41 @@ class CSVRenderer(BaseRenderer):
         Returns:
             str: CSV formatted string
         """
-        elements = []
-
-        # Process tables
-        for table in data.tables:
-            table_csv = self._table_to_csv(table)
-            elements.append(
-                {
-                    "type": "table",
-                    "box": table.box,
-                    "element": table_csv,
-                    "order": table.order,
-                },
-            )
-
-        # Process paragraphs
-        for paragraph in data.paragraphs:
-            contents = self._paragraph_to_csv(paragraph)
-            elements.append(
-                {
-                    "type": "paragraph",
-                    "box": paragraph.box,
-                    "element": contents,
-                    "order": paragraph.order,
-                },
-            )
+        # Elements are (order, type, content) tuples, ordered per kind and then merged
+        tables = [
+            (table.order, "table", self._table_to_csv(table)) for table in data.tables
+        ]
+        paragraphs = [
+            (paragraph.order, "paragraph", self._paragraph_to_csv(paragraph))
+            for paragraph in data.paragraphs
+        ]
 
         # Process figure letters if requested
+        figure_paragraphs = []
         if self.export_figure_letter and hasattr(data, "figures"):
             for figure in data.figures:
                 if hasattr(figure, "paragraphs"):
                     for paragraph in sorted(figure.paragraphs, key=lambda x: x.order):
                         contents = self._paragraph_to_csv(paragraph)
-                        elements.append(
-                            {
-                                "type": "paragraph",
-                                "box": paragraph.box,
-                                "element": contents,
-                                "order": figure.order,
-                            },
-                        )
-
-        # Sort by order
-        elements.sort(key=lambda x: x["order"])
+                        figure_paragraphs.append((figure.order, "paragraph", contents))
 
         # Convert to CSV string
-        return self._elements_to_csv_string(elements)
+        return self._elements_to_csv_string(
+            merge_by_order(tables, paragraphs, figure_paragraphs),
+        )
 
-    def _table_to_csv(self, table: Table) -> str:
+    def _table_to_csv(self, table: Table) -> list[list[str]]:
         """
-        Convert table to CSV string
+        Convert table to CSV rows
 
         Args:
             table: Table data
 
         Returns:
-            str: CSV formatted table
+            list[list[str]]: Table rows, one string per cell
         """
-        # Use the utility function for better table handling
-        return table_to_csv(table, padding=False, drop_empty=False)
+        # Cells are quoted once, by the CSV writer in _elements_to_csv_string
+        return convert_table_array(table, padding=False, drop_empty=False)
 
     def _paragraph_to_csv(self, paragraph: Paragraph) -> str:
         """
@@ -124,38 +102,32 @@ class CSVRenderer(BaseRenderer):
         """
         contents = paragraph.contents
 
-        if self.ignore_line_break:
+        if self.ignore_line_break and "\n" in contents:
             contents = contents.replace("\n", "")
 
         return contents
 
-    def _elements_to_csv_string(self, elements: list[dict[str, Any]]) -> str:
+    def _elements_to_csv_string(self, elements: Iterable[tuple[int, str, Any]]) -> str:
         """
         Convert elements to CSV string using proper CSV writer
 
         Args:
-            elements: List of document elements
+            elements: (order, type, content) document elements in reading order
 
         Returns:
             str: CSV formatted string
         """
-        import io
-
         output = io.StringIO()
         writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
 
-        for element in elements:
-            if element["type"] == "table":
-                # Add table as CSV string
-                table_csv = element["element"]
-                # Split CSV string into lines and write each line
-                for line in table_csv.split("\n"):
-                    if line.strip():  # Skip empty lines
-                        writer.writerow([line])
+        for _order, element_type, element in elements:
+            if element_type == "table":
+                # Write each table row with one column per cell
+                writer.writerows(row for row in element if row)
                 writer.writerow([])  # Empty row between tables
-            elif element["type"] == "paragraph":
+            elif element_type == "paragraph":
                 # Add paragraph as single row
-                writer.writerow([element["element"]])
+                writer.writerow([element])
 
             writer.writerow([])  # Empty row after each element
 
@@ -24,6 +24,8 @@ class RendererFactory:
         "pdf": PDFRenderer,
     }
 
+    _instances: dict[tuple, BaseRenderer] = {}
+
     @classmethod
     def register_renderer(
         cls,
@@ -38,6 +40,7 @@ class RendererFactory:
             renderer_class: Renderer class to register
         """
         cls._renderers[format_name.lower()] = renderer_class
+        cls._instances.clear()
 
     @classmethod
     def get_supported_formats(cls) -> list:
@@ -75,6 +78,38 @@ class RendererFactory:
         renderer_class = cls._renderers[format_type]
         return renderer_class(**kwargs)
 
+    @classmethod
+    def get_renderer(cls, format_type: str, **kwargs) -> BaseRenderer:
+        """
+        Get a shared renderer instance, creating it on first use
+
+        Renderers hold only their construction options, so one instance is
+        reused for every call with the same format and options.
+
+        Args:
+            format_type: Format type (csv, markdown, html, json)
+            **kwargs: Renderer initialization options
+
+        Returns:
+            BaseRenderer: Renderer instance
+
+        Raises:
+            FormatConversionError: If format is not supported
+        """
+        key = (format_type.lower(), tuple(sorted(kwargs.items())))
+        try:
+            renderer = cls._instances.get(key)
+        except TypeError:
+            # unhashable options cannot be cached
+            return cls.create_renderer(format_type, **kwargs)
+
+        if renderer is None:
+            renderer = cls._instances.setdefault(
+                key,
+                cls.create_renderer(format_type, **kwargs),
+            )
+        return renderer
+
     @classmethod
     def is_supported(cls, format_type: str) -> bool:
         """
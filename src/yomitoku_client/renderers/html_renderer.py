@@ -3,14 +3,12 @@ HTML Renderer - For converting document data to HTML format
 """
 
 import os
-import re
-from html import escape
 from typing import Any
 
 import numpy as np
 
 from ..models import DocumentResult, Figure, Paragraph, Table
-from ..utils import remove_dot_prefix, save_image
+from ..utils import convert_text_to_html, remove_dot_prefix, save_figure_crops
 from .base import BaseRenderer
 
 
@@ -107,14 +105,7 @@ class HTMLRenderer(BaseRenderer):
         Returns:
             str: HTML-escaped text
         """
-        # URL regex pattern
-        url_regex = re.compile(r"https?://[^\s<>]+")
-
-        def replace_url(match):
-            url = match.group(0)
-            return escape(url)
-
-        return url_regex.sub(replace_url, escape(text))
+        return convert_text_to_html(text)
 
     def _table_to_html(self, table: Table) -> dict[str, Any]:
         """
@@ -228,20 +219,16 @@ class HTMLRenderer(BaseRenderer):
         """
         elements = []
 
-        for i, figure in enumerate(figures):
-            # Extract and save figure image
-            x1, y1, x2, y2 = map(int, figure.box)
-            figure_img = img[y1:y2, x1:x2, :]
-
-            outdir = os.path.dirname(output_path)
-            basename, ext = os.path.splitext(os.path.basename(output_path))
-
-            save_dir = os.path.join(outdir, self.figure_dir)
+        outdir = os.path.dirname(output_path)
+        basename, ext = os.path.splitext(os.path.basename(output_path))
+        save_dir = os.path.join(outdir, self.figure_dir)
+        if figures:
             os.makedirs(save_dir, exist_ok=True)
 
+        figure_paths = []
+        for i, figure in enumerate(figures):
             figure_name = f"{basename}_figure_{i}_page_{page}.png"
-            figure_path = os.path.join(save_dir, figure_name)
-            save_image(figure_img, figure_path)
+            figure_paths.append(os.path.join(save_dir, figure_name))
 
             relative_path = os.path.join(self.figure_dir, figure_name)
 
@@ -272,6 +259,8 @@ class HTMLRenderer(BaseRenderer):
                         },
                     )
 
+        save_figure_crops(img, figures, figure_paths)
+
         return elements
 
     def _figure_to_html(self, relative_path: str, width: int, caption=None) -> str:
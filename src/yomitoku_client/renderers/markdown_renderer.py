@@ -3,13 +3,18 @@ Markdown Renderer - For converting document data to Markdown format
 """
 
 import os
-import re
-from typing import Any
+from collections.abc import Iterable
 
 import numpy as np
 
 from ..models import DocumentResult, Figure, Paragraph, Table
-from ..utils import escape_markdown_special_chars, remove_dot_prefix, save_image
+from ..utils import (
+    escape_markdown_special_chars,
+    is_dot_list_item,
+    merge_by_order,
+    remove_dot_prefix,
+    save_figure_crops,
+)
 from .base import BaseRenderer
 
 
@@ -45,6 +50,11 @@ class MarkdownRenderer(BaseRenderer):
         self.figure_width = figure_width
         self.figure_dir = figure_dir
         self.table_format = table_format
+        # Paragraph formatters by role, bound once so overrides are honored
+        self._role_formatters = {
+            "section_headings": self._format_heading,
+            "list_item": self._format_list_item,
+        }
 
     def render(
         self,
@@ -65,48 +75,31 @@ class MarkdownRenderer(BaseRenderer):
         Returns:
             str: Markdown formatted string
         """
-        elements = []
+        if self.table_format == "html":
+            table_to_markdown = self._table_to_html
+        else:
+            table_to_markdown = self._table_to_markdown
 
-        # Process tables
-        for table in data.tables:
-            if self.table_format == "html":
-                table_md = self._table_to_html(table)
-            else:
-                table_md = self._table_to_markdown(table)
-            elements.append(
-                {
-                    "type": "table",
-                    "box": table.box,
-                    "element": table_md,
-                    "order": table.order,
-                },
-            )
-
-        # Process paragraphs
-        for paragraph in data.paragraphs:
-            md_content = self._paragraph_to_markdown(paragraph)
-            elements.append(
-                {
-                    "type": "paragraph",
-                    "box": paragraph.box,
-                    "element": md_content,
-                    "order": paragraph.order,
-                },
-            )
+        # Elements are (order, text) tuples, ordered per kind and then merged
+        tables = [(table.order, table_to_markdown(table)) for table in data.tables]
+        paragraphs = [
+            (paragraph.order, self._paragraph_to_markdown(paragraph))
+            for paragraph in data.paragraphs
+        ]
 
         # Process figures if requested
+        figures = []
         if self.export_figure and img is not None and hasattr(data, "figures"):
-            figure_elements = self._figures_to_markdown(
+            figures = self._figures_to_markdown(
                 data.figures,
                 img,
                 output_path=output_path,
                 page=page,
             )
-            elements.extend(figure_elements)
 
-        # Sort by order
-        elements.sort(key=lambda x: x["order"])
-        return self._elements_to_markdown_string(elements)
+        return self._elements_to_markdown_string(
+            merge_by_order(tables, paragraphs, figures),
+        )
 
     def _paragraph_to_markdown(self, paragraph: Paragraph) -> str:
         """
@@ -121,24 +114,30 @@ class MarkdownRenderer(BaseRenderer):
         contents = paragraph.contents
         indent = paragraph.indent_level or 0
 
-        if self.ignore_line_break:
-            contents = contents.replace("\n", "")
-        else:
-            contents = contents.replace("\n", "<br>")
+        # Most text has no line breaks, so skip the replacement for it
+        if "\n" in contents:
+            contents = contents.replace(
+                "\n",
+                "" if self.ignore_line_break else "<br>",
+            )
 
         # Handle different paragraph roles
-        if paragraph.role == "section_headings":
-            contents = escape_markdown_special_chars(contents)
-            contents = "# " + contents
-        elif paragraph.role == "list_item":
-            contents = self._build_list_item_markdown(contents)
-            if indent > 0:
-                contents = " " * ((indent - 1) * 4) + contents
-        else:
-            contents = escape_markdown_special_chars(contents)
+        format_contents = self._role_formatters.get(paragraph.role, self._format_text)
+        return format_contents(contents, indent) + "\n"
+
+    def _format_text(self, contents: str, _indent: int) -> str:
+        return escape_markdown_special_chars(contents)
+
+    def _format_heading(self, contents: str, _indent: int) -> str:
+        return "# " + escape_markdown_special_chars(contents)
 
-        return contents + "\n"
+    def _format_list_item(self, contents: str, indent: int) -> str:
+        contents = self._build_list_item_markdown(contents)
+        if indent > 0:
+            contents = " " * ((indent - 1) * 4) + contents
+        return contents
 
+    # Formatter method names per role; other roles are only escaped as plain text
     def _table_to_markdown(self, table: Table) -> str:
         """
         Convert table to Markdown table
@@ -152,28 +151,18 @@ class MarkdownRenderer(BaseRenderer):
         num_rows = table.n_row
         num_cols = table.n_col
 
-        table_array = [["" for _ in range(num_cols)] for _ in range(num_rows)]
+        table_array = [[""] * num_cols for _ in range(num_rows)]
 
+        line_break = "" if self.ignore_line_break else "<br>"
         for cell in table.cells:
-            row = cell.row - 1
-            col = cell.col - 1
-            row_span = cell.row_span
-            col_span = cell.col_span
-            contents = cell.contents
-
-            contents = escape_markdown_special_chars(contents)
-            if self.ignore_line_break:
-                contents = contents.replace("\n", "")
-            else:
-                contents = contents.replace("\n", "<br>")
-
-            for i in range(row, row + row_span):
-                for j in range(col, col + col_span):
-                    if i == row and j == col:
-                        table_array[i][j] = contents
+            contents = escape_markdown_special_chars(cell.contents)
+            if "\n" in contents:
+                contents = contents.replace("\n", line_break)
+            # Spanned cells keep their contents in the top-left cell only
+            table_array[cell.row - 1][cell.col - 1] = contents
 
         # Build markdown table
-        md_table = ""
+        caption = ""
 
         # Add caption if available
         if table.caption:
@@ -184,17 +173,16 @@ class MarkdownRenderer(BaseRenderer):
                 caption_text = table.caption.get("contents", "")
             else:
                 caption_text = str(table.caption)
-            md_table += f"**{escape_markdown_special_chars(caption_text)}**\n\n"
+            caption = f"**{escape_markdown_special_chars(caption_text)}**\n\n"
 
-        # Add table header
-        for row in table_array:
-            md_table += "| " + " | ".join(cell for cell in row) + " |\n"
+        rows = ["| " + " | ".join(row) + " |" for row in table_array]
 
-            # Add separator line after first row
-            if table_array.index(row) == 0:
-                md_table += "| " + " | ".join("---" for _ in row) + " |\n"
+        # Add separator line after the header (first) row
+        if rows:
+            rows.insert(1, "| " + " | ".join(["---"] * num_cols) + " |")
+            rows.append("")
 
-        return md_table + "\n"
+        return caption + "\n".join(rows) + "\n"
 
     def _table_to_html(self, table: Table) -> str:
         """
@@ -283,7 +271,7 @@ class MarkdownRenderer(BaseRenderer):
 
     def _is_dot_list_item(self, contents: str) -> bool:
         """Check if content is a dot list item"""
-        return re.match(r"^[·\-●·・]", contents) is not None
+        return is_dot_list_item(contents)
 
     def _figures_to_markdown(
         self,
@@ -291,7 +279,7 @@ class MarkdownRenderer(BaseRenderer):
         img: np.ndarray,
         output_path: str,
         page: int = 0,
-    ) -> list[dict[str, Any]]:
+    ) -> list[tuple[int, str]]:
         """
         Convert figures to Markdown with image files
 
@@ -301,24 +289,20 @@ class MarkdownRenderer(BaseRenderer):
             output_path: Output path for references
 
         Returns:
-            List of figure elements
+            List of (order, markdown) figure elements
         """
         elements = []
 
-        for i, figure in enumerate(figures):
-            # Extract and save figure image
-            x1, y1, x2, y2 = map(int, figure.box)
-            figure_img = img[y1:y2, x1:x2, :]
-
-            outdir = os.path.dirname(output_path)
-            basename, ext = os.path.splitext(os.path.basename(output_path))
-            save_dir = os.path.join(outdir, self.figure_dir)
+        outdir = os.path.dirname(output_path)
+        basename, ext = os.path.splitext(os.path.basename(output_path))
+        save_dir = os.path.join(outdir, self.figure_dir)
+        if figures:
             os.makedirs(save_dir, exist_ok=True)
 
+        figure_paths = []
+        for i, figure in enumerate(figures):
             figure_name = f"{basename}_figure_{i}_p_{page}.png"
-            figure_path = os.path.join(save_dir, figure_name)
-
-            save_image(figure_img, figure_path)
+            figure_paths.append(os.path.join(save_dir, figure_name))
 
             relative_path = os.path.join(self.figure_dir, figure_name)
 
@@ -338,45 +322,32 @@ class MarkdownRenderer(BaseRenderer):
 
             fig_html += "</figure>\n"
 
-            elements.append(
-                {"type": "figure", "element": fig_html, "order": figure.order},
-            )
+            elements.append((figure.order, fig_html))
 
             # Process figure letters if requested
             if self.export_figure_letter and hasattr(figure, "paragraphs"):
                 for paragraph in sorted(figure.paragraphs, key=lambda x: x.order):
                     md_content = self._paragraph_to_markdown(paragraph)
-                    elements.append(
-                        {
-                            "type": "paragraph",
-                            "element": md_content,
-                            "order": figure.order,
-                        },
-                    )
+                    elements.append((figure.order, md_content))
+
+        save_figure_crops(img, figures, figure_paths)
 
         return elements
 
-    def _elements_to_markdown_string(self, elements: list[dict[str, Any]]) -> str:
+    def _elements_to_markdown_string(
+        self,
+        elements: Iterable[tuple[int, str]],
+    ) -> str:
         """
         Convert elements to markdown string
 
         Args:
-            elements: List of document elements
+            elements: (order, markdown) document elements in reading order
 
         Returns:
             str: Markdown formatted string
         """
-        output = []
-
-        for element in elements:
-            if (
-                element["type"] == "table"
-                or element["type"] == "paragraph"
-                or element["type"] == "figure"
-            ):
-                output.append(element["element"])
-
-        return "\n".join(output)
+        return "\n".join(element for _order, element in elements)
 
     def get_supported_formats(self) -> list:
         """Get supported formats"""
@@ -2,11 +2,13 @@
 PDF Renderer - For converting document data to searchable PDF format
 """
 
-import numpy as np
+from typing import TYPE_CHECKING
 
 from ..models import DocumentResult
 from .base import BaseRenderer
-from .searchable_pdf import create_searchable_pdf
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class PDFRenderer(BaseRenderer):
@@ -26,7 +28,7 @@ class PDFRenderer(BaseRenderer):
     def render(
         self,
         data: DocumentResult,
-        img: np.ndarray | None = None,
+        img: "np.ndarray | None" = None,
     ) -> str:
         """
         Render document data to PDF format (returns path to generated PDF)
@@ -41,6 +43,9 @@ class PDFRenderer(BaseRenderer):
         """
         # PDF renderer doesn't return content directly, but saves to file
         # This method is mainly for interface compatibility
+        # ReportLab is imported on first use to keep package import light
+        from .searchable_pdf import create_searchable_pdf
+
         return create_searchable_pdf(
             images=[img],
             docs=[data],
@@ -1,10 +1,11 @@
-import os
+from functools import cache
 from io import BytesIO
 
 import jaconv
 import numpy as np
 from PIL import Image
 from reportlab.lib.colors import Color
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfbase.ttfonts import TTFont
@@ -16,74 +17,46 @@ from ..models import DocumentResult
 FONT_PATH = ROOT_DIR + "/resource/MPLUS1p-Medium.ttf"
 
 
-def calc_intersection(rect_a, rect_b):
-    ax1, ay1, ax2, ay2 = map(int, rect_a)
-    bx1, by1, bx2, by2 = map(int, rect_b)
-
-    # 交差領域の左上と右下の座標
-    ix1 = max(ax1, bx1)
-    iy1 = max(ay1, by1)
-    ix2 = min(ax2, bx2)
-    iy2 = min(ay2, by2)
-
-    overlap_width = max(0, ix2 - ix1)
-    overlap_height = max(0, iy2 - iy1)
-
-    if overlap_width == 0 or overlap_height == 0:
-        return None
-
-    return [ix1, iy1, ix2, iy2]
-
-
-def calc_overlap_ratio(rect_a, rect_b):
-    intersection = calc_intersection(rect_a, rect_b)
-    if intersection is None:
-        return 0, None
-
-    ix1, iy1, ix2, iy2 = intersection
-
-    overlap_width = ix2 - ix1
-    overlap_height = iy2 - iy1
-    bx1, by1, bx2, by2 = rect_b
-
-    b_area = (bx2 - bx1) * (by2 - by1)
-    overlap_area = overlap_width * overlap_height
-
-    overlap_ratio = overlap_area / b_area
-    return overlap_ratio, intersection
-
-
-def is_contained(rect_a, rect_b, threshold=0.8):
-    """二つの矩形A, Bが与えられたとき、矩形Bが矩形Aに含まれるかどうかを判定する。
-    ずれを許容するため、重複率求め、thresholdを超える場合にTrueを返す。
-
-
-    Args:
-        rect_a (np.array): x1, y1, x2, y2
-        rect_b (np.array): x1, y1, x2, y2
-        threshold (float, optional): 判定の閾値. Defaults to 0.9.
-
-    Returns:
-        bool: 矩形Bが矩形Aに含まれる場合True
+def _poly2rects(words):
     """
+    Convert the polygons of words to rectangles.
+    Returns an array of shape (N, 4) in the format [x_min, y_min, x_max, y_max].
+    """
+    if not words:
+        return np.zeros((0, 4), dtype=int)
 
-    overlap_ratio, _ = calc_overlap_ratio(rect_a, rect_b)
-
-    return overlap_ratio > threshold
+    points = np.array([word.points for word in words], dtype=int)
+    return np.concatenate([points.min(axis=1), points.max(axis=1)], axis=1)
 
 
-def _poly2rect(points):
+def _containment_matrix(container_boxes, word_rects, threshold):
     """
-    Convert a polygon defined by its corner points to a rectangle.
-    The points should be in the format [[x1, y1], [x2, y2], [x3, y3], [x4, y4]].
+    Check for every container and word whether the word is contained in the
+    container, as utils.is_contained does for a single pair.
+    Returns a boolean array of shape (len(container_boxes), len(word_rects)).
     """
-    points = np.array(points, dtype=int)
-    x_min = points[:, 0].min()
-    x_max = points[:, 0].max()
-    y_min = points[:, 1].min()
-    y_max = points[:, 1].max()
+    boxes = np.asarray(container_boxes, dtype=float).reshape(-1, 4).astype(int)
+
+    overlap_width = np.minimum(boxes[:, None, 2], word_rects[None, :, 2]) - np.maximum(
+        boxes[:, None, 0], word_rects[None, :, 0]
+    )
+    overlap_height = np.minimum(boxes[:, None, 3], word_rects[None, :, 3]) - np.maximum(
+        boxes[:, None, 1], word_rects[None, :, 1]
+    )
+    overlapped = (overlap_width > 0) & (overlap_height > 0)
+
+    word_area = (word_rects[:, 2] - word_rects[:, 0]) * (
+        word_rects[:, 3] - word_rects[:, 1]
+    )
+    overlap_area = np.where(overlapped, overlap_width * overlap_height, 0)
+    overlap_ratio = np.divide(
+        overlap_area,
+        word_area[None, :],
+        out=np.zeros(overlap_area.shape, dtype=float),
+        where=overlapped,
+    )
 
-    return [x_min, y_min, x_max, y_max]
+    return overlap_ratio > threshold
 
 
 def _calc_font_size(content, bbox_height, bbox_width):
@@ -117,6 +90,12 @@ def to_full_width(text):
     return jaconv_text
 
 
+@cache
+def _load_font(font_path: str) -> TTFont:
+    # TTFontはフォントファイル全体を解析するため、パスごとに一度だけ読み込む
+    return TTFont("MPLUS1p-Medium", font_path)
+
+
 def create_searchable_pdf(
     docs: list[DocumentResult],
     images: list[Image.Image],
@@ -134,19 +113,20 @@ def create_searchable_pdf(
     if font_path is None:
         font_path = FONT_PATH
 
-    pdfmetrics.registerFont(TTFont("MPLUS1p-Medium", font_path))
+    pdfmetrics.registerFont(_load_font(font_path))
 
     packet = BytesIO()
     c = canvas.Canvas(packet)
 
-    for i, (image, doc) in enumerate(zip(images, docs, strict=True)):
-        image_path = f"tmp_{i}.png"
-        image.save(image_path, format="JPEG", quality=90)
+    for image, doc in zip(images, docs, strict=True):
+        # 一時ファイルを作らずメモリ上でJPEG化する（並列実行時の競合を避ける）
+        image_buffer = BytesIO()
+        image.save(image_buffer, format="JPEG", quality=90)
+        image_buffer.seek(0)
         w, h = image.size
 
         c.setPageSize((w, h))
-        c.drawImage(image_path, 0, 0, width=w, height=h)
-        os.remove(image_path)
+        c.drawImage(ImageReader(image_buffer), 0, 0, width=w, height=h)
 
         # Collect all text containers
         containers = []
@@ -209,40 +189,36 @@ def create_searchable_pdf(
         # Sort containers by reading order
         containers = sorted(containers, key=lambda c: (c["order"], c["sub_order"]))
 
+        # Word rectangles are computed once and matched against all containers
+        word_rects = _poly2rects(doc.words)
+        rects = word_rects.tolist()
+        contained = _containment_matrix(
+            [container["box"] for container in containers],
+            word_rects,
+            0.5,
+        )
+
         all_words = []
-        for container in containers:
-            container_words = []
-            for word in doc.words:
-                word_box = _poly2rect(word.points)
-                if is_contained(container["box"], word_box, 0.5):
-                    container_words.append(word)
+        for container, row in zip(containers, contained, strict=True):
+            indices = np.flatnonzero(row).tolist()
 
             # Sort words within the container
             if container["direction"] == "vertical":
                 # Right-to-left column, then top-to-bottom
-                container_words.sort(
-                    key=lambda w: (
-                        -_poly2rect(w.points)[0],
-                        _poly2rect(w.points)[1],
-                    ),
-                )
+                indices.sort(key=lambda k: (-rects[k][0], rects[k][1]))
             else:
                 # Top-to-bottom, then left-to-right
-                container_words.sort(
-                    key=lambda w: (
-                        _poly2rect(w.points)[1],
-                        _poly2rect(w.points)[0],
-                    ),
-                )
-            all_words.extend(container_words)
+                indices.sort(key=lambda k: (rects[k][1], rects[k][0]))
+            all_words.extend(indices)
 
         # Set transparent color for text
         text_color = Color(1, 1, 1, alpha=0)
         c.setFillColor(text_color)
 
-        for word in all_words:
+        for k in all_words:
+            word = doc.words[k]
             text = word.content
-            bbox = _poly2rect(word.points)
+            bbox = rects[k]
             direction = word.direction
 
             x1, y1, x2, y2 = bbox
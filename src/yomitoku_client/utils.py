@@ -1,7 +1,17 @@
+import csv
+import heapq
+import importlib
 import io
 import json
+import math
 import os
 import re
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +23,59 @@ from .constants import (
     SUPPORT_INPUT_FORMAT,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_DOT_PREFIX_RE = re.compile(r"^[·\-●・]")
+_DOT_PREFIX_STRIP_RE = re.compile(r"^[·\-●・]\s*")
+_NUMERIC_PREFIX_RE = re.compile(r"^[\(]?\d+[\.\)]?\s*")
+_URL_RE = re.compile(r"https?://[^\s<>]+")
+
+
+def lazy_getattr(package: str, lazy_attrs: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ (PEP 562) that imports attributes lazily
+
+    Args:
+        package: __name__ of the package exposing the attributes
+        lazy_attrs: Mapping of attribute name to the module defining it,
+            relative to the package
+
+    Returns:
+        Callable: __getattr__ function for the package. Each attribute is
+        imported on first access and then stored on the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in lazy_attrs:
+            module = importlib.import_module(lazy_attrs[name], package)
+            value = getattr(module, name)
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+def merge_by_order(*elements: list[tuple]) -> Iterator[tuple]:
+    """
+    Merge lists of (order, ...) elements into one stream in reading order
+
+    Each list is stably sorted by order (a single pass when it is already in
+    order) and the lists are merged, so elements sharing an order come out
+    in argument order, as with a stable sort of the concatenated lists.
+
+    Args:
+        *elements: Lists of tuples whose first item is the reading order
+
+    Returns:
+        Iterator[tuple]: Elements of all lists in reading order
+    """
+    key = itemgetter(0)
+    return heapq.merge(*(sorted(e, key=key) for e in elements), key=key)
+
 
 def make_page_index(page_index: int | list[int] | None, num_pages) -> list[int]:
     if page_index is None:
@@ -25,6 +88,46 @@ def make_page_index(page_index: int | list[int] | None, num_pages) -> list[int]:
     return page_index
 
 
+def json_loads(data: str | bytes | bytearray) -> Any:
+    """
+    Parse a JSON document, using orjson when it is available
+
+    Args:
+        data: JSON document as str or UTF-8 encoded bytes
+
+    Returns:
+        Any: Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON, using orjson when it is available
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        bytes: UTF-8 encoded JSON document (non-ASCII characters are kept as is)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS  # json同様、str以外のキーも許容
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    # orjsonと同じバイト列になるよう、区切り文字の空白を揃える
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode("utf-8")
+
+
 def load_image(image_path: str) -> np.ndarray:
     """
     Open an image file.
@@ -71,15 +174,23 @@ def load_image(image_path: str) -> np.ndarray:
     return pages
 
 
-def load_pdf(pdf_path: str, dpi=200) -> list[np.ndarray]:
+def load_pdf(
+    pdf_path: str,
+    dpi=200,
+    pages: list[int] | None = None,
+) -> list[np.ndarray]:
     """
     Open a PDF file.
 
     Args:
         pdf_path (str): path to the PDF file
+        dpi (int): rendering DPI
+        pages (list[int], optional): page indices to render. If None, all
+            pages are rendered
 
     Returns:
-        list[np.ndarray]: list[:, :, ::-1 of image data(BGR)
+        list[np.ndarray]: list[:, :, ::-1 of image data(BGR), in the order of
+            ``pages`` when it is given
     """
 
     pdf_path = Path(pdf_path)
@@ -99,11 +210,15 @@ def load_pdf(pdf_path: str, dpi=200) -> list[np.ndarray]:
 
     try:
         doc = pypdfium2.PdfDocument(pdf_path)
-        renderer = doc.render(
-            pypdfium2.PdfBitmap.to_pil,
-            scale=dpi / 72,
-        )
-        images = list(renderer)
+        if pages is None:
+            renderer = doc.render(
+                pypdfium2.PdfBitmap.to_pil,
+                scale=dpi / 72,
+            )
+            images = list(renderer)
+        else:
+            # 指定ページだけをラスター化する
+            images = [doc[i].render(scale=dpi / 72).to_pil() for i in pages]
         images = [np.array(image.convert("RGB"))[:, :, ::-1] for image in images]
 
         doc.close()
@@ -149,6 +264,68 @@ def load_pdf_to_bytes(pdf_path: str, dpi=200) -> list[bytes]:
         raise RuntimeError(f"Failed to convert PDF to images: {e}") from e
 
 
+def open_pdf(pdf_path: str) -> pypdfium2.PdfDocument:
+    """
+    Open a PDF so that its pages can be rendered one by one.
+
+    The caller is responsible for closing the returned document.
+
+    Args:
+        pdf_path (str): path to the PDF file
+
+    Returns:
+        pypdfium2.PdfDocument: opened PDF document
+    """
+
+    pdf_path = Path(pdf_path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"File not found: {pdf_path}")
+
+    if pdf_path.suffix.lower() != ".pdf":
+        raise ValueError("Only PDF files are supported.")
+
+    try:
+        return pypdfium2.PdfDocument(pdf_path)
+    except Exception as e:
+        raise RuntimeError(f"Failed to open the PDF file: {e}") from e
+
+
+def render_pdf_page_to_bytes(
+    doc: pypdfium2.PdfDocument,
+    index: int,
+    dpi=200,
+    lock=None,
+) -> bytes:
+    """
+    Render a single page of an opened PDF into image bytes (PNG format).
+
+    Args:
+        doc (pypdfium2.PdfDocument): opened PDF document
+        index (int): page index (0-based)
+        dpi (int): rendering DPI
+        lock (threading.Lock | None): lock held around the pdfium calls when
+            the document is shared between threads (pdfium is not thread-safe)
+
+    Returns:
+        bytes: PNG byte data of the page
+    """
+
+    try:
+        with lock or nullcontext():
+            page = doc[index]
+            try:
+                image = page.render(scale=dpi / 72).to_pil()
+            finally:
+                page.close()
+
+        # PNGのエンコードはロックの外で行い、スレッド間で並列に実行する
+        buf = io.BytesIO()
+        image.save(buf, format="PNG")  # PNGとして保存（非破壊圧縮）
+        return buf.getvalue()
+    except Exception as e:
+        raise RuntimeError(f"Failed to convert PDF page {index} to image: {e}") from e
+
+
 def load_tiff_to_bytes(tiff_path: str) -> list[bytes]:
     im = Image.open(tiff_path)
     pages = []
@@ -166,6 +343,9 @@ def load_tiff_to_bytes(tiff_path: str) -> list[bytes]:
     return pages
 
 
+_MARKDOWN_ESCAPE_TABLE = str.maketrans({c: f"\\{c}" for c in "`*{}[]()#+!~|-"})
+
+
 def escape_markdown_special_chars(text: str) -> str:
     """
     Escape markdown special characters
@@ -176,8 +356,7 @@ def escape_markdown_special_chars(text: str) -> str:
     Returns:
         str: Escaped text
     """
-    special_chars = r"([`*{}[\]()#+!~|-])"
-    return re.sub(special_chars, r"\\\1", text)
+    return text.translate(_MARKDOWN_ESCAPE_TABLE)
 
 
 def remove_dot_prefix(contents: str) -> str:
@@ -190,16 +369,18 @@ def remove_dot_prefix(contents: str) -> str:
     Returns:
         str: Content without dot prefix
     """
-    return re.sub(r"^[·\-●·・]\s*", "", contents, count=1).strip()
+    return _DOT_PREFIX_STRIP_RE.sub("", contents, count=1).strip()
 
 
-def save_image(img: np.ndarray, path: str) -> None:
+def save_image(img: np.ndarray, path: str, create_dir: bool = True) -> None:
     """
     Save image to file
 
     Args:
         img: Image array to save
         path: Path to save the image
+        create_dir: Whether to create the parent directory. Callers saving
+            many images into a directory they already created pass False
 
     Raises:
         ImportError: If cv2 is not installed
@@ -212,17 +393,82 @@ def save_image(img: np.ndarray, path: str) -> None:
             "OpenCV is required for image saving. Install with: pip install opencv-python",
         ) from e
 
-    basedir = os.path.dirname(path)
-    if basedir:
-        os.makedirs(basedir, exist_ok=True)
+    if create_dir:
+        basedir = os.path.dirname(path)
+        if basedir:
+            os.makedirs(basedir, exist_ok=True)
 
     success, buffer = cv2.imencode(".png", img)
 
     if not success:
         raise ValueError("Failed to encode image")
 
-    with open(path, "wb") as f:
-        f.write(buffer.tobytes())
+    # エンコード済みバッファをそのまま書き込み、bytes へのコピーを省く
+    buffer.tofile(path)
+
+
+def map_in_threads(func: Callable, *iterables, max_workers: int = 8) -> list:
+    """
+    Call a function over zipped arguments, overlapping the calls on threads
+
+    Meant for file writes and per-page image work (drawing, encoding), which
+    release the GIL. This package parallelizes pages with threads only and
+    never starts worker processes: forking a process that already runs client
+    or boto3 threads can deadlock, and page images would otherwise be pickled
+    across processes. A single call runs in the current thread. Errors from
+    any call are raised to the caller.
+
+    Args:
+        func: Function to call with one item from each iterable
+        *iterables: Arguments, one iterable per positional parameter
+        max_workers: Maximum number of threads
+
+    Returns:
+        list: Results of the calls, in argument order
+    """
+    args = list(zip(*iterables, strict=True))
+    if len(args) <= 1:
+        return [func(*arg) for arg in args]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as executor:
+        futures = [executor.submit(func, *arg) for arg in args]
+        return [future.result() for future in futures]
+
+
+def save_images(imgs: list[np.ndarray], paths: list[str]) -> None:
+    """
+    Save several images into directories that already exist
+
+    The images are encoded and written concurrently. Crops can be passed as
+    views of the source image; nothing is copied before encoding.
+
+    Args:
+        imgs: Image arrays to save
+        paths: Destination path of each image
+
+    Raises:
+        ValueError: If failed to encode an image
+    """
+    map_in_threads(partial(save_image, create_dir=False), imgs, paths)
+
+
+def save_figure_crops(img: np.ndarray, figures: list[Any], paths: list[str]) -> None:
+    """
+    Crop figures out of a page image and save them, one file per figure
+
+    The crops are views of the page image and are encoded and written
+    concurrently by save_images.
+
+    Args:
+        img: Source image array
+        figures: Figure objects whose boxes are cropped
+        paths: Destination path of each figure, in directories that exist
+    """
+    crops = []
+    for figure in figures:
+        x1, y1, x2, y2 = map(int, figure.box)
+        crops.append(img[y1:y2, x1:x2])
+    save_images(crops, paths)
 
 
 def save_figure(
@@ -248,21 +494,20 @@ def save_figure(
 
     saved_paths = []
 
-    for i, figure in enumerate(figures):
-        x1, y1, x2, y2 = map(int, figure.box)
-        figure_img = img[y1:y2, x1:x2, :]
-
-        save_dir = os.path.dirname(out_path)
-        save_dir = os.path.join(save_dir, figure_dir)
+    save_dir = os.path.join(os.path.dirname(out_path), figure_dir)
+    if figures:
         os.makedirs(save_dir, exist_ok=True)
 
-        filename = os.path.splitext(os.path.basename(out_path))[0]
-        figure_name = f"{filename}_figure_{i}.png"
-        figure_path = os.path.join(save_dir, figure_name)
+    filename = os.path.splitext(os.path.basename(out_path))[0]
 
-        save_image(figure_img, figure_path)
+    figure_paths = []
+    for i in range(len(figures)):
+        figure_name = f"{filename}_figure_{i}.png"
+        figure_paths.append(os.path.join(save_dir, figure_name))
         saved_paths.append(os.path.join(figure_dir, figure_name))
 
+    save_figure_crops(img, figures, figure_paths)
+
     return saved_paths
 
 
@@ -276,7 +521,7 @@ def is_numeric_list_item(contents: str) -> bool:
     Returns:
         bool: True if it's a numeric list item
     """
-    return re.match(r"^[\(]?\d+[\.\)]?\s*", contents) is not None
+    return _NUMERIC_PREFIX_RE.match(contents) is not None
 
 
 def is_dot_list_item(contents: str) -> bool:
@@ -289,7 +534,7 @@ def is_dot_list_item(contents: str) -> bool:
     Returns:
         bool: True if it's a dot list item
     """
-    return re.match(r"^[·\-●·・]", contents) is not None
+    return _DOT_PREFIX_RE.match(contents) is not None
 
 
 def remove_numeric_prefix(contents: str) -> str:
@@ -302,7 +547,7 @@ def remove_numeric_prefix(contents: str) -> str:
     Returns:
         str: Content without numeric prefix
     """
-    return re.sub(r"^[\(]?\d+[\.\)]?\s*", "", contents, count=1).strip()
+    return _NUMERIC_PREFIX_RE.sub("", contents, count=1).strip()
 
 
 def convert_text_to_html(text: str) -> str:
@@ -317,14 +562,15 @@ def convert_text_to_html(text: str) -> str:
     """
     from html import escape
 
-    # URL regex pattern
-    url_regex = re.compile(r"https?://[^\s<>]+")
-
     def replace_url(match):
         url = match.group(0)
         return escape(url)
 
-    return url_regex.sub(replace_url, escape(text))
+    escaped = escape(text)
+    # URL を含まない (大半の) テキストでは正規表現の走査を省く
+    if "http" not in escaped:
+        return escaped
+    return _URL_RE.sub(replace_url, escaped)
 
 
 def load_charset(charset_path: str) -> str:
@@ -404,18 +650,8 @@ def calc_distance(rect_a: list[float], rect_b: list[float]) -> float:
     ax1, ay1, ax2, ay2 = map(int, rect_a)
     bx1, by1, bx2, by2 = map(int, rect_b)
 
-    # Center coordinates of rectangle A
-    center_a_x = (ax1 + ax2) / 2
-    center_a_y = (ay1 + ay2) / 2
-
-    # Center coordinates of rectangle B
-    center_b_x = (bx1 + bx2) / 2
-    center_b_y = (by1 + by2) / 2
-
-    # Calculate distance between centers
-    distance = ((center_a_x - center_b_x) ** 2 + (center_a_y - center_b_y) ** 2) ** 0.5
-
-    return distance
+    # Distance between centers ((a1 + a2) / 2 - (b1 + b2) / 2 per axis)
+    return math.hypot((ax1 + ax2 - bx1 - bx2) / 2, (ay1 + ay2 - by1 - by2) / 2)
 
 
 def is_contained(
@@ -434,8 +670,17 @@ def is_contained(
     Returns:
         bool: True if rect_b is contained in rect_a
     """
-    overlap_ratio, _ = calc_overlap_ratio(rect_a, rect_b)
-    return overlap_ratio > threshold
+    ax1, ay1, ax2, ay2 = map(int, rect_a)
+    bx1, by1, bx2, by2 = rect_b
+
+    # Same result as calc_overlap_ratio without building the intersection list
+    overlap_width = min(ax2, int(bx2)) - max(ax1, int(bx1))
+    overlap_height = min(ay2, int(by2)) - max(ay1, int(by1))
+    if overlap_width <= 0 or overlap_height <= 0:
+        return threshold < 0  # overlap ratio is 0
+
+    b_area = (bx2 - bx1) * (by2 - by1)
+    return overlap_width * overlap_height / b_area > threshold
 
 
 def calc_intersection(rect_a: list[float], rect_b: list[float]) -> list[int] | None:
@@ -528,12 +773,8 @@ def quad_to_xyxy(quad: list[list[float]]) -> tuple[float, float, float, float]:
     Returns:
         Tuple[float, float, float, float]: Bounding box (x1, y1, x2, y2)
     """
-    x1 = min([x for x, _ in quad])
-    y1 = min([y for _, y in quad])
-    x2 = max([x for x, _ in quad])
-    y2 = max([y for _, y in quad])
-
-    return x1, y1, x2, y2
+    xs, ys = zip(*quad, strict=True)
+    return min(xs), min(ys), max(xs), max(ys)
 
 
 def convert_table_array(
@@ -555,21 +796,21 @@ def convert_table_array(
     n_rows = table.n_row
     n_cols = table.n_col
 
-    table_array = [["" for _ in range(n_cols)] for _ in range(n_rows)]
+    table_array = [[""] * n_cols for _ in range(n_rows)]
 
     for cell in table.cells:
         row = cell.row - 1
         col = cell.col - 1
-        row_span = cell.row_span
-        col_span = cell.col_span
         contents = cell.contents
 
         table_array[row][col] = contents
         if padding:
-            for r in range(row_span):
-                for c in range(col_span):
-                    if row + r + 1 < n_rows and col + c + 1 < n_cols:
-                        table_array[row + r + 1][col + c + 1] = contents
+            # 基準セルから1行1列ずらした結合範囲 (表の外にはみ出す部分は除く) を
+            # 同じ内容で埋める
+            col_end = min(col + cell.col_span + 1, n_cols)
+            span = [contents] * (col_end - col - 1)
+            for r in range(row + 1, min(row + cell.row_span + 1, n_rows)):
+                table_array[r][col + 1 : col_end] = span
 
     if drop_empty:
         # Drop empty rows
@@ -600,12 +841,12 @@ def table_to_csv(table: Any, padding: bool = False, drop_empty: bool = False) ->
         str: CSV string representation of the table
     """
     table_array = convert_table_array(table, padding=padding, drop_empty=drop_empty)
-    csv_lines = []
 
-    for row in table_array:
-        csv_lines.append(",".join(f'"{cell}"' for cell in row))
+    output = io.StringIO()
+    writer = csv.writer(output, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    writer.writerows(table_array)
 
-    return "\n".join(csv_lines)
+    return output.getvalue().removesuffix("\n")
 
 
 def convert_table_array_to_dict(
@@ -2,10 +2,18 @@
 Visualizers module - For data visualization and extraction capabilities
 """
 
-from .base import BaseVisualizer
-from .document_visualizer import DocumentVisualizer
+from ..utils import lazy_getattr
 
 __all__ = [
     "BaseVisualizer",
     "DocumentVisualizer",
 ]
+
+
+# Modules imported on first attribute access (PEP 562) to keep import light
+_LAZY_ATTRS = {
+    "BaseVisualizer": ".base",
+    "DocumentVisualizer": ".document_visualizer",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_ATTRS)
@@ -3,6 +3,8 @@ Document visualizer for layout analysis and OCR results
 """
 
 import logging
+import math
+from functools import lru_cache
 from typing import Any
 
 import cv2
@@ -12,6 +14,42 @@ from PIL import Image, ImageDraw, ImageFont, features
 from ..constants import PALETTE
 from .base import BaseVisualizer
 
+# 要素カテゴリ・役割ごとのパレット上の色番号
+_CATEGORY_COLOR_INDEX = {
+    name: i
+    for i, name in enumerate(
+        [
+            "paragraphs",
+            "tables",
+            "figures",
+            "section_headings",
+            "page_header",
+            "page_footer",
+            "picture",
+            "logo",
+            "code",
+            "seal",
+            "list_item",
+            "caption",
+            "inline_formula",
+            "display_formula",
+            "index",
+        ],
+    )
+}
+
+
+@lru_cache(maxsize=8)
+def _load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per path and size (parsing it is costly)"""
+    return ImageFont.truetype(font_path, font_size)
+
+
+@lru_cache(maxsize=1)
+def _has_raqm() -> bool:
+    """Check once whether Pillow was built with libraqm"""
+    return features.check_feature(feature="raqm")
+
 
 class DocumentVisualizer(BaseVisualizer):
     """Document layout and OCR visualization"""
@@ -56,11 +94,15 @@ class DocumentVisualizer(BaseVisualizer):
         Returns:
             Visualized image as numpy array
         """
-        if mode == "layout":
-            out = self.visualize_layout_detail(img, results)
-            return self.visualize_reading_order(out, results)
-        elif mode == "ocr":
-            return self.visualize_ocr(img, results)
+        name = self._MODE_VISUALIZERS.get(mode)
+        if name is None:
+            return None
+        # Resolve by name so subclass overrides are used
+        return getattr(self, name)(img, results)
+
+    def _visualize_layout(self, img: np.ndarray, results: Any) -> np.ndarray:
+        out = self.visualize_layout_detail(img, results)
+        return self.visualize_reading_order(out, results)
 
     def visualize_reading_order(
         self,
@@ -182,6 +224,11 @@ class DocumentVisualizer(BaseVisualizer):
             )
             return img
 
+    _MODE_VISUALIZERS = {
+        "layout": "_visualize_layout",
+        "ocr": "visualize_ocr",
+    }
+
     def _reading_order_visualizer(self, img, elements, line_color, tip_size):
         """Internal function for drawing reading order arrows"""
         out = img.copy()
@@ -202,7 +249,11 @@ class DocumentVisualizer(BaseVisualizer):
                 prev_y1 + (prev_y2 - prev_y1) / 2,
             )
 
-            arrow_length = np.linalg.norm(np.array(cur_center) - np.array(prev_center))
+            # 2 点間の距離はスカラー演算で十分 (配列を作らない)
+            arrow_length = math.hypot(
+                cur_center[0] - prev_center[0],
+                cur_center[1] - prev_center[1],
+            )
 
             # tipLength を計算（矢印長さに対する固定サイズの割合）
             tip_length = tip_size / arrow_length if arrow_length > 0 else 0
@@ -252,12 +303,12 @@ class DocumentVisualizer(BaseVisualizer):
         line_color=(0, 255, 0),
     ):
         """OCR visualizer"""
-        out = img.copy()
-        pillow_img = Image.fromarray(out)
+        # Image.fromarray は画素を Pillow 側に複製するため、入力は書き換わらない
+        pillow_img = Image.fromarray(img)
         draw = ImageDraw.Draw(pillow_img)
-        font = ImageFont.truetype(font_path, font_size)
+        font = _load_font(font_path, font_size)
 
-        has_raqm = features.check_feature(feature="raqm")
+        has_raqm = _has_raqm()
         if not has_raqm:
             self.logger.warning(
                 "libraqm is not installed. Vertical text rendering is not supported. Rendering horizontally instead.",
@@ -301,24 +352,11 @@ class DocumentVisualizer(BaseVisualizer):
 
     def visualize_element(self, img, category, elements):
         """Visualize elements"""
-        out = img.copy()
-        categories = [
-            "paragraphs",
-            "tables",
-            "figures",
-            "section_headings",
-            "page_header",
-            "page_footer",
-            "picture",
-            "logo",
-            "code",
-            "seal",
-            "list_item",
-            "caption",
-            "inline_formula",
-            "display_formula",
-            "index",
-        ]
+        return self._draw_elements(img.copy(), category, elements)
+
+    def _draw_elements(self, out, category, elements):
+        """Draw elements onto ``out`` in place"""
+        category_color_index = _CATEGORY_COLOR_INDEX[category]
 
         for element in elements:
             box = element.box
@@ -327,11 +365,11 @@ class DocumentVisualizer(BaseVisualizer):
             if category != "tables":
                 role = element.role
 
-            color_index = categories.index(category)
+            color_index = category_color_index
             if role is None:
                 role = ""
             else:
-                color_index = categories.index(role)
+                color_index = _CATEGORY_COLOR_INDEX[role]
                 role = f"({role})"
 
             color = self.palette[color_index % len(self.palette)]
@@ -362,7 +400,7 @@ class DocumentVisualizer(BaseVisualizer):
                         caption_box = caption["box"]
 
                     if caption_box is not None:
-                        color_index = categories.index("caption")
+                        color_index = _CATEGORY_COLOR_INDEX["caption"]
                         color = self.palette[color_index % len(self.palette)]
                         x1, y1, x2, y2 = tuple(map(int, caption_box))
                         out = cv2.rectangle(out, (x1, y1), (x2, y2), color, 2)
@@ -393,7 +431,7 @@ class DocumentVisualizer(BaseVisualizer):
                                     para_box = paragraph["box"]
 
                                 if para_box is not None:
-                                    color_index = categories.index("paragraphs")
+                                    color_index = _CATEGORY_COLOR_INDEX["paragraphs"]
                                     color = self.palette[
                                         color_index % len(self.palette)
                                     ]
@@ -425,20 +463,23 @@ class DocumentVisualizer(BaseVisualizer):
 
     def layout_visualizer_detail(self, results, img):
         """Detailed layout visualizer"""
+        # 入力画像を一度だけ複製し、以降の描画はすべてその複製に直接行う
         out = img.copy()
-        # results_dict = results.dict()
-        out = self.visualize_element(out, "paragraphs", results.paragraphs)
-        out = self.visualize_element(out, "tables", results.tables)
-        out = self.visualize_element(out, "figures", results.figures)
+        out = self._draw_elements(out, "paragraphs", results.paragraphs)
+        out = self._draw_elements(out, "tables", results.tables)
+        out = self._draw_elements(out, "figures", results.figures)
 
         for table in results.tables:
-            out = self.table_visualizer(out, table)
+            out = self._draw_table(out, table)
 
         return out
 
     def table_visualizer(self, img, table):
         """Table visualizer"""
-        out = img.copy()
+        return self._draw_table(img.copy(), table)
+
+    def _draw_table(self, out, table):
+        """Draw table cells onto ``out`` in place"""
         cells = table.cells
         for cell in cells:
             box = cell.box
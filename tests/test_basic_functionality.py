@@ -12,6 +12,18 @@ from yomitoku_client.exceptions import (
 )
 
 
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run the JSON helpers with orjson and with the standard json fallback"""
+    from yomitoku_client import utils
+
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
 class TestUtilityFunctions:
     """Test utility functions with proper mocking"""
 
@@ -83,6 +95,101 @@ class TestUtilityFunctions:
         cleaned_numeric = remove_numeric_prefix(numeric_text)
         assert cleaned_numeric == "Numbered item"
 
+    def test_merge_by_order_is_stable_across_lists(self):
+        """Test merging element lists in reading order"""
+        from yomitoku_client.utils import merge_by_order
+
+        tables = [(3, "t3"), (1, "t1")]
+        paragraphs = [(1, "p1"), (2, "p2")]
+        figures = [(1, "f1")]
+
+        merged = list(merge_by_order(tables, paragraphs, figures))
+        assert merged == sorted(tables + paragraphs + figures, key=lambda e: e[0])
+        assert [text for _order, text in merged] == ["t1", "p1", "f1", "p2", "t3"]
+
+    def test_map_in_threads_keeps_order_and_raises(self):
+        """Test running calls on threads with results in argument order"""
+        from yomitoku_client.utils import map_in_threads
+
+        assert map_in_threads(pow, [2, 3, 4], [2, 2, 2]) == [4, 9, 16]
+        assert map_in_threads(pow, [5], [2]) == [25]
+        assert map_in_threads(pow, [], []) == []
+
+        with pytest.raises(ZeroDivisionError):
+            map_in_threads(divmod, [1, 2], [1, 0])
+
+    def test_lazy_getattr_imports_on_first_access(self, monkeypatch):
+        """Test lazily imported package attributes"""
+        import json
+        import sys
+        import types
+
+        from yomitoku_client.utils import lazy_getattr
+
+        package = types.ModuleType("lazy_package")
+        monkeypatch.setitem(sys.modules, "lazy_package", package)
+        getattr_ = lazy_getattr("lazy_package", {"dumps": "json"})
+
+        assert getattr_("dumps") is json.dumps
+        # Loaded attributes are stored on the package
+        assert package.dumps is json.dumps
+        with pytest.raises(AttributeError):
+            getattr_("loads")
+
+    def test_visualizers_package_loads_modules_on_access(self):
+        """Test importing the visualizers package defers its modules"""
+        import subprocess
+        import sys
+
+        # A fresh interpreter, since this process has imported them already
+        code = (
+            "import sys\n"
+            "import yomitoku_client.visualizers as visualizers\n"
+            "name = 'yomitoku_client.visualizers.document_visualizer'\n"
+            "assert name not in sys.modules\n"
+            "assert 'PIL.ImageDraw' not in sys.modules\n"
+            "visualizers.DocumentVisualizer\n"
+            "assert name in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_json_loads_accepts_str_and_bytes(self):
+        """Test JSON parsing helper with text and UTF-8 bytes"""
+        from yomitoku_client.utils import json_loads
+
+        text = '{"contents": "日本語", "box": [1, 2, 3, 4]}'
+        assert json_loads(text) == {"contents": "日本語", "box": [1, 2, 3, 4]}
+        assert json_loads(text.encode("utf-8")) == json_loads(text)
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_json_dumps_round_trip(self):
+        """Test JSON serialization helper keeps non-ASCII text as UTF-8"""
+        from yomitoku_client.utils import json_dumps, json_loads
+
+        record = {"file_path": "日本語.pdf", "success": True, "error": None}
+        data = json_dumps(record)
+        assert isinstance(data, bytes)
+        assert "日本語".encode() in data
+        assert json_loads(data) == record
+        assert json_loads(json_dumps(record, indent=True)) == record
+        # Non-str keys are stringified, as with the standard json module
+        assert json_loads(json_dumps({1: "a"})) == {"1": "a"}
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_json_dumps_output_is_backend_independent(self):
+        """Test JSON serialization gives the same bytes with or without orjson"""
+        from yomitoku_client.utils import json_dumps
+
+        record = {"box": [1, 2], "role": None, 3: {"ok": True}, "empty": []}
+        assert json_dumps(record) == (
+            b'{"box":[1,2],"role":null,"3":{"ok":true},"empty":[]}'
+        )
+        assert json_dumps(record, indent=True) == (
+            b'{\n  "box": [\n    1,\n    2\n  ],\n  "role": null,\n'
+            b'  "3": {\n    "ok": true\n  },\n  "empty": []\n}'
+        )
+
 
 class TestRendererFactory:
     """Test renderer factory with proper mocking"""
@@ -120,6 +227,18 @@ class TestRendererFactory:
         with pytest.raises(FormatConversionError):
             RendererFactory.create_renderer("unsupported_format")
 
+    def test_renderer_factory_get_renderer_reuses_instances(self):
+        """Test shared renderer instances per format and options"""
+        from yomitoku_client.renderers.factory import RendererFactory
+
+        renderer = RendererFactory.get_renderer("markdown", ignore_line_break=True)
+        assert renderer is RendererFactory.get_renderer(
+            "MARKDOWN", ignore_line_break=True
+        )
+        assert renderer is not RendererFactory.get_renderer(
+            "markdown", ignore_line_break=False
+        )
+
     def test_renderer_factory_is_supported(self):
         """Test renderer factory support check"""
         from yomitoku_client.renderers.factory import RendererFactory
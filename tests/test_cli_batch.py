@@ -277,3 +277,98 @@ def test_batch_command_with_pages_split_visualize_and_advanced_options(
 
         vis_img = out_visualize / f"{base_name}_layout_page_{i}.jpg"
         assert vis_img.exists()
+
+
+def test_batch_command_skips_up_to_date_outputs(
+    monkeypatch,
+    tmp_path: Path,
+    runner,
+    sample_api_result,
+):
+    """
+    出力が解析結果より新しい場合は再生成をスキップし、
+    --force 指定時は再生成することを確認するテスト。
+    """
+
+    _patch_process_batch(monkeypatch, sample_api_result)
+
+    output_dir = tmp_path / "outputs"
+    args = [
+        "--input_dir",
+        str(DATA_DIR),
+        "--output_dir",
+        str(output_dir),
+        "--endpoint",
+        "test-endpoint",
+        "--file_format",
+        "json",
+        "--vis_mode",
+        "none",
+    ]
+
+    result = runner.invoke(batch_command, args)
+    assert result.exit_code == 0, result.output
+
+    # 2回目以降は中間 JSON を書き換えない process_batch に差し替える
+    async def noop_process_batch(**kwargs):
+        return None
+
+    monkeypatch.setattr(batch_module, "process_batch", noop_process_batch)
+
+    calls = []
+    original_parse = batch_module.parse_pydantic_model
+
+    def counting_parse(data, validate=True):
+        calls.append(data)
+        return original_parse(data, validate=validate)
+
+    monkeypatch.setattr(batch_module, "parse_pydantic_model", counting_parse)
+
+    result = runner.invoke(batch_command, args)
+    assert result.exit_code == 0, result.output
+    assert calls == []
+
+    result = runner.invoke(batch_command, [*args, "--force"])
+    assert result.exit_code == 0, result.output
+    assert len(calls) == 1
+
+    # オプションが変わった場合は --force なしでも再生成する
+    result = runner.invoke(batch_command, [*args, "--ignore_line_break"])
+    assert result.exit_code == 0, result.output
+    assert len(calls) == 2
+
+    result = runner.invoke(batch_command, [*args, "--ignore_line_break"])
+    assert result.exit_code == 0, result.output
+    assert len(calls) == 2
+
+
+def test_batch_command_fails_when_post_processing_fails(
+    monkeypatch,
+    tmp_path: Path,
+    runner,
+):
+    """
+    解析結果の整形に失敗したファイルがある場合、
+    終了コードが 0 以外になることを確認するテスト。
+    """
+
+    # 整形できない中間 JSON を出力する process_batch に差し替える
+    _patch_process_batch(monkeypatch, {"result": "broken"})
+
+    output_dir = tmp_path / "outputs"
+    result = runner.invoke(
+        batch_command,
+        [
+            "--input_dir",
+            str(DATA_DIR),
+            "--output_dir",
+            str(output_dir),
+            "--endpoint",
+            "test-endpoint",
+            "--vis_mode",
+            "none",
+        ],
+    )
+
+    assert result.exit_code != 0
+    assert "Failed to post-process 1 file(s)" in result.output
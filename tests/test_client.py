@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from pathlib import Path
 
 import pytest
@@ -10,10 +11,12 @@ from yomitoku_client.client import (
     CircuitConfig,
     InvokeResult,
     PagePayload,
+    RequestConfig,
     YomitokuClient,
     guess_content_type,
 )
 from yomitoku_client.exceptions import YomitokuInvokeError
+from yomitoku_client.utils import open_pdf
 
 
 def test_analyze_merges_pages_without_aws(monkeypatch, tmp_path: Path):
@@ -77,6 +80,47 @@ def test_analyze_merges_pages_without_aws(monkeypatch, tmp_path: Path):
     assert items[1]["num_page"] == 1
 
 
+def test_analyze_renders_selected_pdf_pages_on_demand(monkeypatch, tmp_path: Path):
+    """PDF は指定ページだけがラスター化され、PNG として invoke されることを確認"""
+    from PIL import Image
+
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    pdf_path = tmp_path / "sample.pdf"
+    pages = [Image.new("RGB", (32, 32), color) for color in ("red", "green", "blue")]
+    pages[0].save(pdf_path, save_all=True, append_images=pages[1:])
+
+    received = []
+
+    async def fake_ainvoke_one(self, payload, request_timeout=None):
+        received.append(payload)
+        return InvokeResult(index=payload.index, raw_dict={"result": [{}]})
+
+    monkeypatch.setattr(YomitokuClient, "_ainvoke_one", fake_ainvoke_one)
+
+    opened = []
+
+    def spy_open_pdf(path):
+        doc = open_pdf(path)
+        opened.append(doc)
+        return doc
+
+    monkeypatch.setattr(client_module, "open_pdf", spy_open_pdf)
+
+    client = YomitokuClient(endpoint="dummy-endpoint", region=None)
+    result = client.analyze(str(pdf_path), dpi=72, page_index=[0, 2, 5])
+
+    assert [item["num_page"] for item in result["result"]] == [0, 2]
+    assert sorted(p.index for p in received) == [0, 2]
+    for payload in received:
+        assert payload.content_type == "image/png"
+        assert payload.body.startswith(b"\x89PNG")
+        assert payload.source_name == "sample.pdf"
+
+    # ラスター化が終わったPDFは閉じられている
+    assert all(doc.raw is None for doc in opened)
+
+
 def test_analyze_batch_async_without_aws(monkeypatch, tmp_path: Path):
     """
     analyze_batch_async を、実際の SageMaker / AWS API を呼ばずにテストする。
@@ -340,7 +384,7 @@ def test_circuit_breaker_opens_after_threshold_and_blocks_requests(monkeypatch):
     assert client._circuit_failures == 0
 
     # 7) クールダウン時間後（時間を進める）に再度リクエストすると、
-    #    ふたたび invoke_endpoint が呼ばれる（ただし今回も失敗する想定）
+    #    half_open の試行リクエストとして invoke_endpoint が呼ばれる（今回も失敗する想定）
     fake_time["value"] = client._circuit_open_until + 1
 
     with pytest.raises(YomitokuInvokeError):
@@ -348,8 +392,157 @@ def test_circuit_breaker_opens_after_threshold_and_blocks_requests(monkeypatch):
 
     # インボーク回数が 1 回増えていること
     assert fake_runtime.calls == cfg.threshold + 1
-    # 失敗カウントも 1 に戻っている（_record_failure が働いている）
-    assert client._circuit_failures == 1
+    # 試行が失敗したので、クールダウンを倍にして再オープンしている
+    assert client._circuit_state == "open"
+    assert client._circuit_cooldown == cfg.cooldown_time * 2
+    assert (
+        client._circuit_open_until == fake_time["value"] + cfg.cooldown_time * 2 * 1000
+    )
+
+
+def test_circuit_breaker_half_open_allows_single_probe(monkeypatch):
+    """half_open 中は試行リクエストを1件だけ通し、成功でクローズすることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    fake_time = {"value": 0}
+    monkeypatch.setattr(client_module, "now_ms", lambda: fake_time["value"])
+
+    cfg = CircuitConfig(threshold=1, cooldown_time=10, max_cooldown_time=15)
+    client = YomitokuClient(endpoint="dummy", region=None, circuit_config=cfg)
+
+    client._record_failure()
+    assert client._circuit_state == "open"
+
+    # クールダウン経過後、最初の1件だけが試行リクエストとして通る
+    fake_time["value"] = client._circuit_open_until
+    assert client._check_circuit() is True
+    with pytest.raises(YomitokuInvokeError) as excinfo:
+        client._check_circuit()
+    assert "Circuit open" in str(excinfo.value)
+
+    # 試行の失敗でクールダウンが延長される（上限あり）
+    client._record_failure()
+    assert client._circuit_cooldown == 15
+
+    fake_time["value"] = client._circuit_open_until
+    assert client._check_circuit() is True
+    client._record_success()
+    client._end_probe()
+
+    # 試行の成功でクローズし、クールダウンは初期値に戻る
+    assert client._circuit_state == "closed"
+    assert client._circuit_cooldown == cfg.cooldown_time
+    assert client._check_circuit() is False
+
+
+def test_shed_delay_when_latency_degrades(monkeypatch):
+    """エラーがなくてもレイテンシが悪化すると確率的にリクエストを遅らせることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(
+        endpoint="dummy",
+        region=None,
+        request_config=RequestConfig(read_timeout=60),
+    )
+
+    # 平常時は遅らせない
+    for _ in range(5):
+        client._record_latency(1.0)
+    assert client._latency_drop_ratio() == 0.0
+    assert client._shed_delay(0.5) is None
+
+    # 直近のレイテンシがタイムアウト近くまで悪化
+    for _ in range(20):
+        client._record_latency(55.0)
+    ratio = client._latency_drop_ratio()
+    assert 0.0 < ratio <= client_module._LATENCY_DROP_MAX
+
+    # 遅らせるだけで、リクエスト自体は拒否しない
+    monkeypatch.setattr(client_module.random, "random", lambda: 0.0)
+    delay = client._shed_delay(0.5)
+    assert delay is not None
+    assert 0.0 < delay <= client._request_config.backoff_max
+    assert client._check_circuit() is False
+
+    monkeypatch.setattr(client_module.random, "random", lambda: 0.99)
+    assert client._shed_delay(0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_one_delays_shed_request_and_succeeds(monkeypatch):
+    """間引かれたリクエストは待機後に送信され、失敗扱いにならないことを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(
+        endpoint="dummy",
+        region=None,
+        request_config=RequestConfig(max_retries=0, backoff_base=0.01),
+    )
+
+    sheds = iter([0.01, 0.01, None])
+    monkeypatch.setattr(client, "_shed_delay", lambda prev: next(sheds))
+    monkeypatch.setattr(
+        client,
+        "_invoke_one",
+        lambda payload: InvokeResult(index=payload.index, raw_dict={}),
+    )
+
+    payload = PagePayload(
+        index=0,
+        content_type="image/png",
+        body=b"dummy",
+        source_name="dummy.png",
+    )
+    result = await client._ainvoke_one(payload)
+
+    assert result.index == 0
+    assert client._limiter.target == client._limiter.limit
+
+
+def test_total_timeout_uses_p95_latency_when_enough_samples(monkeypatch):
+    """実測レイテンシが十分にあれば p95 から全体タイムアウトを見積もることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(
+        endpoint="dummy",
+        region=None,
+        max_workers=4,
+        request_config=RequestConfig(read_timeout=60, max_retries=3, backoff_max=20),
+    )
+
+    # サンプル不足時は read_timeout ベース: (60 + 5) * ceil(8 / 4) * 1.5 + 再試行分
+    assert client._total_timeout(8, None) == pytest.approx(65 * 2 * 1.5 + 3 * (65 + 20))
+
+    for _ in range(client_module._LATENCY_MIN_SAMPLES):
+        client._record_latency(20.0)
+    assert client._total_timeout(8, None) == pytest.approx(
+        24.0 * 2 * 1.5 + 3 * (24.0 + 20)
+    )
+
+    # 下限は 30 秒
+    client._request_config.max_retries = 0
+    client._latency_samples.clear()
+    for _ in range(client_module._LATENCY_MIN_SAMPLES):
+        client._record_latency(1.0)
+    assert client._total_timeout(8, None) == 30.0
+
+
+def test_total_timeout_follows_reduced_concurrency(monkeypatch):
+    """AIMD リミッターで同時実行数が絞られると全体タイムアウトが延びることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(
+        endpoint="dummy",
+        region=None,
+        max_workers=4,
+        request_config=RequestConfig(read_timeout=60, max_retries=0),
+    )
+
+    assert client._total_timeout(8, None) == pytest.approx(65 * 2 * 1.5)
+
+    client._limiter.on_failure()
+    assert client._limiter.target == 2
+    assert client._total_timeout(8, None) == pytest.approx(65 * 4 * 1.5)
 
 
 def _make_client_error(status_code: int) -> ClientError:
@@ -415,3 +608,340 @@ def test_record_failure_only_on_retryable_client_errors(
         assert calls["count"] == 1
     else:
         assert calls["count"] == 0
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ('{"result": [{"text": "日本語"}]}'.encode(), {"result": [{"text": "日本語"}]}),
+        (b"not json", None),
+    ],
+)
+def test_invoke_one_parses_response_bytes(monkeypatch, body, expected):
+    """レスポンスの bytes をそのままパースし、不正な JSON はエラーになることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(endpoint="dummy", region=None)
+
+    class FakeBody:
+        def read(self):
+            return body
+
+    class FakeRuntime:
+        def invoke_endpoint(self, **kwargs):
+            return {"Body": FakeBody()}
+
+    client.sagemaker_runtime = FakeRuntime()
+    client.sagemaker = object()
+
+    payload = PagePayload(
+        index=0,
+        content_type="image/png",
+        body=b"dummy",
+        source_name="dummy.png",
+    )
+
+    if expected is None:
+        with pytest.raises(YomitokuInvokeError) as excinfo:
+            client._invoke_one(payload)
+        assert "Failed to decode JSON response" in str(excinfo.value)
+    else:
+        result = client._invoke_one(payload)
+        assert result.raw_dict == expected
+
+
+def test_merge_results_sets_num_page_without_mutating_inputs():
+    """全ページの要素に num_page が付き、入力の raw_dict は変更されないことを確認"""
+    first = {"result": [{"text": "a"}, {"text": "b"}]}
+    second = {"result": [{"text": "c"}]}
+
+    merged = client_module._merge_results(
+        [
+            InvokeResult(index=0, raw_dict=first),
+            InvokeResult(index=3, raw_dict=second),
+        ]
+    )
+
+    assert [item["num_page"] for item in merged["result"]] == [0, 0, 3]
+    assert [item["text"] for item in merged["result"]] == ["a", "b", "c"]
+    assert first == {"result": [{"text": "a"}, {"text": "b"}]}
+    assert second == {"result": [{"text": "c"}]}
+
+
+def test_clients_own_thread_pool_and_close_waits(monkeypatch):
+    """クライアントごとにスレッドプールを持ち、close で実行中の処理を待つことを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    first = YomitokuClient(endpoint="dummy", region=None, max_workers=3)
+    second = YomitokuClient(endpoint="dummy", region=None, max_workers=3)
+    assert first._pool is not second._pool
+
+    done = []
+    first._pool.submit(lambda: (time.sleep(0.05), done.append(True)))
+    first.close()
+    assert done == [True]
+
+    # 他のクライアントのプールには影響しない
+    assert second._pool.submit(lambda: 1).result() == 1
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_clients_do_not_queue_behind_each_other(
+    monkeypatch, tmp_path: Path
+):
+    """複数クライアントの同時実行で、他クライアントの待ちがタイムアウトに含まれないことを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+    monkeypatch.setattr(
+        client_module,
+        "load_image_bytes",
+        lambda path_img, content_type, dpi: ([b"p0", b"p1"], "image/png"),
+    )
+    monkeypatch.setattr(client_module, "guess_content_type", lambda p: "image/png")
+
+    def slow_invoke_one(self, payload):
+        time.sleep(0.2)
+        return InvokeResult(index=payload.index, raw_dict={"result": [{}]})
+
+    monkeypatch.setattr(YomitokuClient, "_invoke_one", slow_invoke_one)
+
+    img_path = tmp_path / "dummy.png"
+    img_path.write_bytes(b"dummy")
+
+    clients = [
+        YomitokuClient(endpoint="dummy", region=None, max_workers=2) for _ in range(2)
+    ]
+    results = await asyncio.gather(
+        *(
+            c.analyze_async(str(img_path), request_timeout=0.3, total_timeout=5)
+            for c in clients
+        )
+    )
+    for c in clients:
+        c.close()
+
+    assert [len(r["result"]) for r in results] == [2, 2]
+
+
+def test_runtime_client_is_shared_per_config(monkeypatch):
+    """同じ設定のクライアント間で sagemaker-runtime クライアントが共有されることを確認"""
+    created = []
+
+    class FakeSession:
+        def __init__(self, region_name=None, profile_name=None):
+            pass
+
+        def client(self, service_name, config=None):
+            created.append((service_name, config.max_pool_connections))
+            return object()
+
+    monkeypatch.setattr(client_module.boto3, "Session", FakeSession)
+    client_module._runtime_client.cache_clear()
+
+    try:
+        first = client_module._runtime_client("ap-northeast-1", None, 60, 10, 32)
+        second = client_module._runtime_client("ap-northeast-1", None, 60, 10, 32)
+        other = client_module._runtime_client("ap-northeast-1", None, 60, 10, 10)
+    finally:
+        client_module._runtime_client.cache_clear()
+
+    assert first is second
+    assert other is not first
+    assert created == [("sagemaker-runtime", 32), ("sagemaker-runtime", 10)]
+
+
+def test_ainvoke_one_runs_on_the_calling_loop(monkeypatch):
+    """クライアント生成時と異なるイベントループからでも呼び出せることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(endpoint="dummy", region=None)
+    monkeypatch.setattr(
+        YomitokuClient,
+        "_invoke_one",
+        lambda self, payload: InvokeResult(index=payload.index, raw_dict={}),
+    )
+
+    payload = PagePayload(
+        index=2,
+        content_type="image/png",
+        body=b"dummy",
+        source_name="dummy.png",
+    )
+
+    result = asyncio.run(client._ainvoke_one(payload))
+    assert result.index == 2
+
+
+@pytest.mark.parametrize(
+    "status_code, expected_calls",
+    [
+        (503, 3),  # 再試行対象: 2回失敗後に成功
+        (400, 1),  # 再試行対象外: 即座に失敗
+    ],
+)
+def test_ainvoke_one_retries_retryable_errors_with_async_backoff(
+    monkeypatch, status_code, expected_calls
+):
+    """再試行は boto3 内部ではなくイベントループ上のバックオフで行われることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(
+        endpoint="dummy",
+        region=None,
+        request_config=RequestConfig(max_retries=3, backoff_base=0.0),
+    )
+
+    calls = {"count": 0}
+
+    def fake_invoke_one(self, payload):
+        calls["count"] += 1
+        if calls["count"] < 3:
+            raise YomitokuInvokeError("failed") from _make_client_error(status_code)
+        return InvokeResult(index=payload.index, raw_dict={})
+
+    monkeypatch.setattr(YomitokuClient, "_invoke_one", fake_invoke_one)
+
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+
+    payload = PagePayload(
+        index=0,
+        content_type="image/png",
+        body=b"dummy",
+        source_name="dummy.png",
+    )
+
+    if expected_calls == 1:
+        with pytest.raises(YomitokuInvokeError):
+            asyncio.run(client._ainvoke_one(payload))
+        assert sleeps == []
+    else:
+        assert asyncio.run(client._ainvoke_one(payload)).index == 0
+        assert len(sleeps) == expected_calls - 1
+    assert calls["count"] == expected_calls
+
+
+def test_retry_delay_honors_retry_after_header(monkeypatch):
+    """Retry-After ヘッダーがあればその秒数（上限付き）で待機することを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(
+        endpoint="dummy",
+        region=None,
+        request_config=RequestConfig(backoff_max=5.0),
+    )
+
+    def make_error(retry_after):
+        cause = ClientError(
+            error_response={
+                "Error": {"Code": "ThrottlingException", "Message": "dummy"},
+                "ResponseMetadata": {
+                    "HTTPStatusCode": 429,
+                    "HTTPHeaders": {"retry-after": retry_after},
+                },
+            },
+            operation_name="InvokeEndpoint",
+        )
+        error = YomitokuInvokeError("failed")
+        error.__cause__ = cause
+        return error
+
+    assert client._retry_delay(make_error("2"), prev=0.5) == 2.0
+    assert client._retry_delay(make_error("120"), prev=0.5) == 5.0
+    assert client._retry_delay(YomitokuInvokeError("circuit open"), 0.5) is None
+
+
+def test_retry_delay_uses_decorrelated_jitter(monkeypatch):
+    """待ち時間が base 〜 前回の3倍 の範囲で乱択され、上限で頭打ちになることを確認"""
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+
+    client = YomitokuClient(
+        endpoint="dummy",
+        region=None,
+        request_config=RequestConfig(backoff_base=0.5, backoff_max=4.0),
+    )
+    error = YomitokuInvokeError("failed")
+    error.__cause__ = _make_client_error(503)
+
+    delays = {client._retry_delay(error, prev=2.0) for _ in range(50)}
+    assert all(0.5 <= d <= 4.0 for d in delays)
+    assert len(delays) > 1
+
+
+def test_aimd_limiter_shrinks_on_failure_and_grows_on_success():
+    """失敗で同時実行数が半減し、成功が続くと上限まで戻ることを確認"""
+    limiter = client_module._AIMDLimiter(4)
+
+    limiter.on_failure()
+    assert limiter.target == 2
+    limiter.on_failure()
+    limiter.on_failure()
+    assert limiter.target == 1
+
+    for _ in range(1 + 2 + 3):
+        limiter.on_success()
+    assert limiter.target == 4
+
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.target == 4
+
+
+def test_aimd_limiter_bounds_in_flight_requests():
+    """同時に実行されるリクエスト数が target を超えないことを確認"""
+    limiter = client_module._AIMDLimiter(4)
+    limiter.on_failure()  # target = 2
+
+    state = {"running": 0, "peak": 0}
+
+    async def job():
+        async with limiter:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+
+    async def main():
+        await asyncio.gather(*(job() for _ in range(8)))
+
+    asyncio.run(main())
+    assert state["peak"] == 2
+
+
+def _invoke_error_from(cause: Exception) -> YomitokuInvokeError:
+    error = YomitokuInvokeError("failed")
+    error.__cause__ = cause
+    return error
+
+
+def test_retry_delay_filters_non_retryable_errors(monkeypatch):
+    """一時的なエラーだけを再試行し、恒久的なエラーは即座に失敗させることを確認"""
+    from botocore.exceptions import EndpointConnectionError, NoCredentialsError
+
+    monkeypatch.setattr(YomitokuClient, "_connect", lambda self: None)
+    client = YomitokuClient(endpoint="dummy", region=None)
+
+    throttled = ClientError(
+        error_response={
+            "Error": {"Code": "ThrottlingException", "Message": "dummy"},
+            "ResponseMetadata": {"HTTPStatusCode": 400},
+        },
+        operation_name="InvokeEndpoint",
+    )
+    connection = EndpointConnectionError(endpoint_url="https://example.com")
+    decode = json.JSONDecodeError("truncated", "{", 1)
+
+    assert client._retry_delay(_invoke_error_from(throttled), 0.5) is not None
+    assert client._retry_delay(_invoke_error_from(connection), 0.5) is not None
+    assert client._retry_delay(_invoke_error_from(NoCredentialsError()), 0.5) is None
+    assert client._retry_delay(_invoke_error_from(_make_client_error(424)), 0.5) is None
+
+    # JSON デコード失敗は 1 回だけ再試行
+    assert client._retry_delay(_invoke_error_from(decode), 0.5, attempt=0) is not None
+    assert client._retry_delay(_invoke_error_from(decode), 0.5, attempt=1) is None
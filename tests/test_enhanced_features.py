@@ -77,6 +77,22 @@ class TestVisualizers:
         except Exception as e:
             pytest.fail(f"Visualization failed: {e}")
 
+    def test_document_visualizer_mode_respects_subclass_overrides(self):
+        """Test visualization modes dispatch to overridden methods"""
+
+        class CustomVisualizer(DocumentVisualizer):
+            def visualize_ocr(self, _img, _results):
+                return "ocr"
+
+            def _visualize_layout(self, _img, _results):
+                return "layout"
+
+        visualizer = CustomVisualizer()
+        img = np.zeros((10, 10, 3), dtype=np.uint8)
+        assert visualizer.visualize(img, None, mode="ocr") == "ocr"
+        assert visualizer.visualize(img, None, mode="layout") == "layout"
+        assert visualizer.visualize(img, None, mode="unknown") is None
+
 
 class TestUtils:
     """Test cases for Utility Functions"""
@@ -184,6 +200,24 @@ class TestUtils:
         csv_result = table_to_csv(table)
         assert isinstance(csv_result, str)
         assert "Header1" in csv_result
+        assert csv_result == '"Header1","Header2"\n"Data1","Data2"'
+
+        # Padding copies a spanned cell into the span shifted by one row
+        # and one column, clipped to the table
+        merged_table = MockTable()
+        merged_table.n_row = 3
+        merged_table.n_col = 3
+        merged_table.cells = [MockCell("Merged", 1, 1, row_span=2, col_span=2)]
+        assert convert_table_array(merged_table) == [
+            ["Merged", "", ""],
+            ["", "", ""],
+            ["", "", ""],
+        ]
+        assert convert_table_array(merged_table, padding=True) == [
+            ["Merged", "", ""],
+            ["", "Merged", "Merged"],
+            ["", "Merged", "Merged"],
+        ]
 
         # Test table array to dict
         table_dict = convert_table_array_to_dict(table_array, header_row=1)
@@ -234,6 +268,56 @@ class TestRenderers:
         assert RendererFactory.is_supported("json")
         assert not RendererFactory.is_supported("unsupported")
 
+    def test_markdown_table_separator_only_after_header(self):
+        """Test markdown tables whose rows repeat the header row"""
+        from yomitoku_client.models import Table, TableCell
+        from yomitoku_client.renderers.markdown_renderer import MarkdownRenderer
+
+        cells = [
+            TableCell(
+                box=[0, 0, 1, 1],
+                contents="A",
+                col=1,
+                row=row,
+                col_span=1,
+                row_span=1,
+            )
+            for row in (1, 2)
+        ]
+        table = Table(
+            box=[0, 0, 1, 2],
+            cells=cells,
+            cols=[],
+            n_col=2,
+            n_row=2,
+            order=0,
+            rows=[],
+        )
+
+        md = MarkdownRenderer()._table_to_markdown(table)
+        assert md == "| A |  |\n| --- | --- |\n| A |  |\n\n"
+
+    def test_markdown_role_formatters_respect_subclass_overrides(self):
+        """Test paragraph role dispatch uses overridden formatter methods"""
+        from yomitoku_client.models import Paragraph
+        from yomitoku_client.renderers.markdown_renderer import MarkdownRenderer
+
+        class CustomRenderer(MarkdownRenderer):
+            def _format_heading(self, contents, _indent):
+                return "## " + contents
+
+            def _format_text(self, contents, _indent):
+                return "> " + contents
+
+        renderer = CustomRenderer()
+        heading = Paragraph(
+            box=[0, 0, 1, 1], contents="T", order=0, role="section_headings"
+        )
+        text = Paragraph(box=[0, 0, 1, 1], contents="b", order=1)
+
+        assert renderer._paragraph_to_markdown(heading) == "## T\n"
+        assert renderer._paragraph_to_markdown(text) == "> b\n"
+
 
 class TestImageProcessing:
     """Test cases for Image Processing"""
@@ -254,6 +338,34 @@ class TestImageProcessing:
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
+    def test_save_figure_writes_every_crop(self):
+        """Test saving several figures at once"""
+        from types import SimpleNamespace
+
+        import cv2
+
+        from yomitoku_client.utils import save_figure
+
+        img = np.zeros((100, 100, 3), dtype=np.uint8)
+        img[0:50, 0:50] = 255
+        figures = [
+            SimpleNamespace(box=[0, 0, 50, 50]),
+            SimpleNamespace(box=[50, 50, 100, 100]),
+            SimpleNamespace(box=[0, 50, 40, 100]),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_path = os.path.join(tmpdir, "doc.md")
+            saved = save_figure(figures, img, out_path)
+
+            assert saved == [
+                os.path.join("figures", f"doc_figure_{i}.png") for i in range(3)
+            ]
+            first = cv2.imread(os.path.join(tmpdir, saved[0]))
+            assert first.shape == (50, 50, 3)
+            assert (first == 255).all()
+            assert cv2.imread(os.path.join(tmpdir, saved[2])).shape == (50, 40, 3)
+
 
 class TestIntegration:
     """Integration tests"""
@@ -1,9 +1,11 @@
 import json
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from yomitoku_client import parse_pydantic_model
+from yomitoku_client.exceptions import DocumentAnalysisError
 
 DATA_DIR = Path(__file__).parent / "data"
 
@@ -26,6 +28,53 @@ def target_file() -> str:
     return str(DATA_DIR / "image.pdf")
 
 
+def test_parse_pydantic_model_from_raw_json(raw_response_json):
+    """JSON 文字列 / bytes を直接渡しても同じモデルになること."""
+    text = json.dumps(raw_response_json, ensure_ascii=False)
+
+    expected = parse_pydantic_model(raw_response_json)
+    assert parse_pydantic_model(text) == expected
+    assert parse_pydantic_model(text.encode("utf-8")) == expected
+
+
+def test_parse_pydantic_model_without_validation_matches(raw_response_json):
+    """validate=False でも検証した場合と同じモデルになること."""
+    validated = parse_pydantic_model(raw_response_json)
+    fast = parse_pydantic_model(raw_response_json, validate=False)
+
+    assert fast.model_dump() == validated.model_dump()
+
+
+def test_parse_pydantic_model_without_validation_allows_missing_lists(
+    raw_response_json,
+):
+    """validate=False では欠けている要素リストを空として扱うこと."""
+    page = raw_response_json["result"][0]
+    del page["figures"]
+    del page["tables"]
+
+    fast = parse_pydantic_model(raw_response_json, validate=False)
+
+    assert fast.pages[page["num_page"]].figures == []
+    assert fast.pages[page["num_page"]].tables == []
+
+
+def test_parse_pydantic_model_rejects_invalid_by_default(raw_response_json):
+    """デフォルトでは不正な値を DocumentAnalysisError として検出すること."""
+    raw_response_json["result"][0]["words"][0]["points"] = "invalid"
+
+    with pytest.raises(DocumentAnalysisError):
+        parse_pydantic_model(raw_response_json)
+
+
+def test_parse_pydantic_model_rejects_missing_fields(raw_response_json):
+    """必須項目の欠落や型の誤りはパース時に検出すること."""
+    del raw_response_json["result"][0]["paragraphs"][0]["order"]
+
+    with pytest.raises(DocumentAnalysisError):
+        parse_pydantic_model(raw_response_json)
+
+
 def test_to_csv_variants(model, tmp_path: Path):
     # sample.csv として保存
     csv_path = tmp_path / "sample.csv"
@@ -383,3 +432,160 @@ def test_visualize_ocr(model, target_file, tmp_path: Path):
     # H x W x C の配列前提
     assert len(first.shape) == 3
     assert first.shape[2] in (3, 4)  # BGR or BGRA
+
+
+def test_visualize_with_max_workers(model, target_file, tmp_path: Path):
+    """
+    max_workers 指定時もページごとに同じ画像が出力されること.
+    """
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+
+    basename = Path(target_file).stem
+
+    serial = model.visualize(
+        image_path=target_file,
+        mode="layout",
+        output_directory=str(serial_dir),
+    )
+    parallel = model.visualize(
+        image_path=target_file,
+        mode="layout",
+        output_directory=str(parallel_dir),
+        max_workers=2,
+    )
+
+    assert len(parallel) == len(serial) == len(model.pages)
+    for i, (a, b) in enumerate(zip(serial, parallel, strict=True)):
+        assert Path(parallel_dir / f"{basename}_layout_page_{i}.jpg").exists()
+        assert (a == b).all()
+
+
+def test_exports_with_max_workers(model, target_file, tmp_path: Path):
+    """
+    max_workers 指定時も逐次処理と同じ内容がページ順に出力されること.
+    """
+    serial_md = model.to_markdown(
+        output_path=str(tmp_path / "serial" / "out.md"),
+        image_path=target_file,
+    )
+    parallel_md = model.to_markdown(
+        output_path=str(tmp_path / "parallel" / "out.md"),
+        image_path=target_file,
+        max_workers=2,
+    )
+    assert parallel_md == serial_md
+
+    serial_csv = model.to_csv(output_path=str(tmp_path / "serial.csv"))
+    parallel_csv = model.to_csv(
+        output_path=str(tmp_path / "parallel.csv"),
+        max_workers=2,
+    )
+    assert parallel_csv == serial_csv
+    assert (tmp_path / "parallel.csv").read_bytes() == (
+        tmp_path / "serial.csv"
+    ).read_bytes()
+
+
+def test_exports_reuse_loaded_page_images(
+    model, target_file, tmp_path: Path, monkeypatch
+):
+    """
+    読み込み済みのページ画像を渡せば、複数形式の出力でも PDF のラスタライズは一度だけであること.
+    """
+    from yomitoku_client import models as models_module
+
+    calls = []
+    original_load_pdf = models_module.load_pdf
+
+    def counting_load_pdf(*args, **kwargs):
+        calls.append(args)
+        return original_load_pdf(*args, **kwargs)
+
+    monkeypatch.setattr(models_module, "load_pdf", counting_load_pdf)
+
+    images = model.load_page_images(target_file)
+    snapshot = {index: img.copy() for index, img in images.items()}
+
+    model.to_html(
+        output_path=str(tmp_path / "out.html"), image_path=target_file, images=images
+    )
+    model.to_markdown(
+        output_path=str(tmp_path / "out.md"), image_path=target_file, images=images
+    )
+    model.visualize(
+        image_path=target_file,
+        mode="ocr",
+        output_directory=str(tmp_path),
+        images=images,
+    )
+    assert len(calls) == 1
+
+    # 出力の間で共有した画像は書き換えられない
+    for index, img in images.items():
+        assert np.array_equal(img, snapshot[index])
+
+    # 画像を渡さなければ、呼び出しごとに読み込む (プロセス内に保持しない)
+    model.to_html(output_path=str(tmp_path / "out2.html"), image_path=target_file)
+    assert len(calls) == 2
+
+
+def test_separate_export_rewrites_deleted_files(model, tmp_path: Path):
+    """
+    同じ内容を再度出力した場合も、ページごとのファイルが書き出されること.
+    """
+    output_path = tmp_path / "sample.md"
+    model.to_markdown(output_path=str(output_path), mode="separate", page_index=[0])
+
+    page_path = tmp_path / "sample_page_0.md"
+    content = page_path.read_text(encoding="utf-8")
+    page_path.unlink()
+
+    model.to_markdown(output_path=str(output_path), mode="separate", page_index=[0])
+    assert page_path.read_text(encoding="utf-8") == content
+
+
+def test_to_csv_writes_table_cells_as_columns(model, tmp_path: Path):
+    """
+    表の各セルが 1 列として書き出され、引用符・カンマ・改行は一度だけエスケープされること.
+    """
+    import csv
+
+    from yomitoku_client.utils import convert_table_array
+
+    index = next(i for i, page in model.pages.items() if page.tables)
+    table = min(model.pages[index].tables, key=lambda t: t.order)
+    table.cells[0].contents = 'say "hi", then\nbye'
+
+    csv_path = tmp_path / "table.csv"
+    model.to_csv(output_path=str(csv_path), page_index=[index])
+
+    with csv_path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+
+    expected = convert_table_array(table, padding=False, drop_empty=False)
+    start = rows.index(expected[0])
+    assert rows[start : start + len(expected)] == expected
+    assert 'say "hi", then\nbye' in rows[start]
+
+
+def test_visualizer_leaves_input_image_untouched(model):
+    """
+    レイアウト・OCR の可視化は入力画像を書き換えずに新しい画像を返すこと.
+    """
+    import numpy as np
+
+    from yomitoku_client.font_manager import get_font_path
+    from yomitoku_client.visualizers import DocumentVisualizer
+
+    page = model.pages[0]
+    img = np.full((2000, 1500, 3), 255, dtype=np.uint8)
+    img.setflags(write=False)
+
+    visualizer = DocumentVisualizer()
+    layout = visualizer.layout_visualizer_detail(page, img)
+    ocr = visualizer.ocr_visualizer(page.words, img, font_path=get_font_path())
+
+    assert (img == 255).all()
+    assert layout.shape == ocr.shape == img.shape
+    assert (layout != 255).any()
@@ -223,6 +223,21 @@ def test_load_pdf_success(monkeypatch, tmp_path: Path):
     assert (arr[0, 0] == np.array([30, 20, 10])).all()
 
 
+def test_load_pdf_selected_pages(tmp_path: Path):
+    """pages 指定時は指定ページだけが指定順でラスター化される"""
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    pages = [Image.new("RGB", (8, 8), color) for color in colors]
+    pdf_path = tmp_path / "sample.pdf"
+    pages[0].save(pdf_path, save_all=True, append_images=pages[1:])
+
+    all_images = load_pdf(str(pdf_path), dpi=72)
+    selected = load_pdf(str(pdf_path), dpi=72, pages=[2, 0])
+
+    assert len(selected) == 2
+    assert (selected[0] == all_images[2]).all()
+    assert (selected[1] == all_images[0]).all()
+
+
 def test_load_pdf_to_bytes_file_not_found():
     with pytest.raises(FileNotFoundError):
         load_pdf_to_bytes("no_such_file.pdf")
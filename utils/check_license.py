@@ -222,10 +222,11 @@ def run_license_check(allow: list[str], debug: bool = False) -> int:
     try:
         cmd = [uv_path, "run", "pip-licenses", "--format=csv"]
         # Ruff S603/S607 warning: Can be ignored for fixed safe command
+        # Only stdout is parsed; stderr goes straight to the terminal
         result = subprocess.run(  # noqa: S603,S607
             cmd,
             check=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
             text=True,
         )
 